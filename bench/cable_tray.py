@@ -0,0 +1,67 @@
+"""케이블 트레이 엔진 벤치마크.
+
+    python bench/cable_tray.py [--cables 50000] [--segments 500] [--budget 5]
+
+무작위 케이블 스케줄로 segment_fill / size_trays 시간을 측정하고,
+합계가 budget 초를 넘으면 종료 코드 1 을 반환한다.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cable_tray import segment_fill, size_trays  # noqa: E402
+
+DIAMETERS = [0.25, 0.4, 0.6, 0.8, 1.0, 1.25, 1.5, 2.0, 2.5]
+
+
+def make_schedule(n_cables, n_segments, seed=0):
+    rng = np.random.default_rng(seed)
+    segments = np.array([f"TR-{i:04d}" for i in range(n_segments)])
+    cables = pd.DataFrame({"cable_id": np.arange(n_cables),
+                           "segment": segments[rng.integers(0, n_segments, n_cables)],
+                           "dia_in": rng.choice(DIAMETERS, n_cables)})
+    trays = pd.DataFrame({"segment": segments,
+                          "width_in": rng.choice([12, 18, 24, 30, 36], n_segments),
+                          "depth_in": rng.choice([4, 6], n_segments)})
+    return cables, trays
+
+
+def timed(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t)
+    return statistics.median(runs)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cables", type=int, default=50_000)
+    ap.add_argument("--segments", type=int, default=500)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--budget", type=float, default=5.0, help="허용 시간 (초)")
+    args = ap.parse_args()
+
+    cables, trays = make_schedule(args.cables, args.segments)
+    t_fill = timed(lambda: segment_fill(cables, trays), args.repeat)
+    t_size = timed(lambda: size_trays(cables), args.repeat)
+    plan, _ = size_trays(cables)
+
+    print(f"cables={args.cables:,} segments={args.segments:,}")
+    print(f"segment_fill  {t_fill * 1000:9.1f} ms")
+    print(f"size_trays    {t_size * 1000:9.1f} ms  ({len(plan):,} trays, {int(plan['over'].sum())} over limit)")
+    total = t_fill + t_size
+    print(f"total         {total * 1000:9.1f} ms  (budget {args.budget:.1f} s)")
+    sys.exit(0 if total <= args.budget else 1)
+
+
+if __name__ == "__main__":
+    main()
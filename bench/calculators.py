@@ -0,0 +1,130 @@
+"""계산기 마이크로벤치마크.
+
+    python bench/calculators.py [--only evap] [--budget-ms 50] [--save | --compare]
+
+core/ 의 계산 경로마다 호출 1회 시간의 p50/p95/p99 (µs) 와 초당 호출 수를 측정한다.
+배열 입력 케이스(이름에 x 개수)는 호출 1회가 배열 전체 처리다.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.common import add_baseline_args, finish, percentiles  # noqa: E402
+from core import cable_tray, calc, crane, curing, labor, maturity, readymix, units, wrench  # noqa: E402
+from core.catalog import get_catalog  # noqa: E402
+
+N = 10_000  # 배열 케이스 크기
+
+
+def _pour_windows(sites):
+    evap, _, _, ok = curing.score_forecast(*sites)
+    return curing.best_pour_windows(evap, ok, 3)
+
+
+def cases():
+    # (이름, 호출 함수) — 입력은 미리 만들어 두고 호출 시간만 잰다
+    rng = np.random.default_rng(0)
+    cat = get_catalog()
+    grade = cat.bolt_grades()[0]
+    size = cat.bolt_sizes(grade)[0]
+    tf, rh, wind = rng.uniform(40, 100, N), rng.uniform(10, 95, N), rng.uniform(0, 25, N)
+    sites = [a.reshape(50, 24) for a in (tf[:1200], rh[:1200], wind[:1200])]
+    hours, temps = np.full(N, 0.25), rng.uniform(0, 30, N)
+    charts = crane.get_charts()
+    c_name = charts.cranes()[0]
+    c_cfg = charts.configs(c_name)[0]
+    chart = charts.chart(c_name, c_cfg)
+    plan = pd.DataFrame({"crane": c_name, "config": c_cfg, "boom_ft": rng.uniform(40, 80, N),
+                         "radius_ft": rng.uniform(10, 60, N), "load_lbs": rng.uniform(1000, 40000, N)})
+    cables = pd.DataFrame({"segment": rng.integers(0, 200, N).astype(str), "dia_in": rng.choice([0.4, 0.8, 1.25], N)})
+    sched = pd.DataFrame({"crew": rng.choice(list("ABCD"), 200), "people": rng.integers(3, 12, 200),
+                          "rate_hr": rng.uniform(30, 60, 200), "hours": rng.choice([8.0, 10.0, 12.0], 200)})
+    elems = pd.DataFrame({"element_type": rng.choice(["slab", "footing", "wall"], N),
+                          "length": rng.uniform(5, 50, N), "width": rng.uniform(1, 30, N),
+                          "depth": rng.uniform(0.5, 2, N)})
+    frame = pd.DataFrame({"length_ft": rng.uniform(1, 200, N), "slope": rng.choice(list(calc.SLOPES), N)})
+    exprs = [f"{i % 20}' {i % 12}-{i % 8 + 1}/16\"" for i in range(N)]
+    return [
+        # 양생
+        ("evap.scalar", lambda: curing.calc_evaporation_rate(25.0, 60.0, 10.0)),
+        (f"evap.vector x{N}", lambda: curing.evaporation_rate(tf, rh, wind)),
+        ("pour_windows 50x24", lambda: _pour_windows(sites)),
+        (f"maturity x{N}", lambda: maturity.strength_from_maturity(np.cumsum(
+            maturity.maturity_increments(hours, temps)))),
+        # 공학/생활 계산
+        ("bolt_torque", lambda: calc.bolt_torque(size, grade)),
+        ("pipe_drop", lambda: calc.pipe_drop(100.0, "1/4")),
+        ("load_moment", lambda: calc.load_moment(5000.0, 30.0)),
+        ("tray_fill", lambda: calc.tray_fill(24, 4, 1.0, 20)),
+        ("overtime_cost", lambda: calc.overtime_cost(5, 40.0, 2.0, 1.5)),
+        ("net_salary", lambda: calc.net_salary(80000)),
+        ("tip_per_person", lambda: calc.tip_per_person(50.0, 18, 2)),
+        ("mm_to_ft", lambda: calc.mm_to_ft(1000.0)),
+        (f"apply_frame.pipe_drop x{N}", lambda: calc.apply_frame("pipe_drop", frame)),
+        # 호환성 / 단위
+        ("wrench.match_size", lambda: wrench.match_size("19mm")),
+        ("units.parse (cached)", lambda: units.parse("3' 4-1/2\"")),
+        ("units.convert", lambda: units.convert("10 m3", "yd3")),
+        (f"units.convert_many x{N}", lambda: units.convert_many(exprs, "mm")),
+        # 크레인 / 트레이 / 인건비 / 레미콘
+        ("crane.capacity", lambda: chart.capacity(60.0, 25.0)),
+        (f"crane.check_lifts x{N}", lambda: charts.check_lifts(plan)),
+        (f"tray.segment_fill x{N}", lambda: cable_tray.segment_fill(cables)),
+        ("labor.simulate 200x10k", lambda: labor.simulate_overtime(sched, 10_000, workers=1)),
+        (f"readymix.volumes x{N}", lambda: readymix.element_volumes(elems)),
+        ("catalog.search_jha", lambda: cat.search_jha("추락")),
+    ]
+
+
+def measure(fn, min_time=0.2, samples=30):
+    # 1 샘플 = 여러 번 호출한 평균 (타이머 해상도보다 충분히 길게)
+    fn()
+    t = time.perf_counter()
+    fn()
+    once = max(time.perf_counter() - t, 1e-7)
+    number = max(1, int(min_time / samples / once))
+    runs = []
+    for _ in range(samples):
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - t) / number)
+    return runs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--only", help="이름에 이 문자열이 들어간 케이스만")
+    ap.add_argument("--samples", type=int, default=30)
+    ap.add_argument("--min-time", type=float, default=0.2, help="케이스당 측정 시간 (초)")
+    ap.add_argument("--budget-ms", type=float, help="p95 가 이 값을 넘는 케이스가 있으면 종료 코드 1")
+    add_baseline_args(ap)
+    args = ap.parse_args()
+
+    rows = []
+    print(f"{'case':<28}{'p50 µs':>12}{'p95 µs':>12}{'p99 µs':>12}{'ops/s':>12}")
+    for name, fn in cases():
+        if args.only and args.only not in name:
+            continue
+        runs = measure(fn, args.min_time, args.samples)
+        row = {"name": name, **percentiles(runs, 1e6, "us"), "ops_per_s": round(1 / float(np.mean(runs)), 1)}
+        rows.append(row)
+        print(f"{name:<28}{row['p50_us']:>12.1f}{row['p95_us']:>12.1f}{row['p99_us']:>12.1f}{row['ops_per_s']:>12,.0f}")
+
+    code = finish("calculators", rows, args, params={"N": N, "samples": args.samples, "min_time": args.min_time})
+    if args.budget_ms is not None:
+        slow = [r["name"] for r in rows if r["p95_us"] > args.budget_ms * 1000]
+        if slow:
+            print(f"\n예산 초과 ({args.budget_ms:g} ms): {', '.join(slow)}")
+            code = 1
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
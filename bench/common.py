@@ -0,0 +1,120 @@
+"""벤치마크 공용 도구: 백분위, 메모리, 기준값(baseline) 저장/비교.
+
+bench/baselines/*.json 은 기본 옵션으로 --save 한 초기 기준값이다 (파일의 machine / cpus 참고).
+절대값은 장비마다 다르므로 다른 장비에서는 변경 전 트리에서 --save 를 먼저 실행한 뒤 --compare 한다.
+기준값에는 실행 조건 (세션 수, 배열 크기 등) 도 저장되며, 조건이 다르면 비교하지 않고 종료 코드 2 로 끝난다.
+"""
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_DIR = os.path.join(BENCH_DIR, "baselines")
+
+# 비교 시 낮을수록 좋은 지표 / 높을수록 좋은 지표
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "p50_us", "p95_us", "p99_us", "mem_mb_per_session")
+HIGHER_IS_BETTER = ("ops_per_s", "reruns_per_s")
+# 변화율과 함께 이 절대값 이상 바뀌어야 회귀로 봄 (1MB 미만 값의 측정 잡음 제외)
+MIN_DELTA = {"mem_mb_per_session": 5.0}
+
+
+def percentiles(samples, scale=1000.0, unit="ms"):
+    # 초 단위 샘플 → {p50_ms, p95_ms, p99_ms}
+    if not len(samples):
+        return {f"p{q}_{unit}": None for q in (50, 95, 99)}
+    q = np.percentile(np.asarray(samples, dtype=float) * scale, [50, 95, 99])
+    return {f"p{p}_{unit}": round(float(v), 3) for p, v in zip((50, 95, 99), q)}
+
+
+def rss_mb():
+    # 현재 RSS (리눅스는 /proc, 그 외는 최대 RSS 로 대체)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def add_baseline_args(ap):
+    ap.add_argument("--save", action="store_true", help="결과를 기준값으로 저장")
+    ap.add_argument("--compare", action="store_true", help="저장된 기준값과 비교 (회귀 시 종료 코드 1)")
+    ap.add_argument("--threshold", type=float, default=15.0, help="회귀 판정 기준 (%%)")
+    ap.add_argument("--baseline-dir", default=BASELINE_DIR)
+
+
+def _path(baseline_dir, name):
+    return os.path.join(baseline_dir, f"{name}.json")
+
+
+def save_baseline(name, rows, baseline_dir=BASELINE_DIR, params=None):
+    # params: 결과에 영향을 주는 실행 조건 (세션 수, 배열 크기 등) — 비교 시 일치해야 함
+    os.makedirs(baseline_dir, exist_ok=True)
+    doc = {"created": time.strftime("%Y-%m-%d %H:%M:%S"), "python": platform.python_version(),
+           "machine": platform.machine(), "cpus": os.cpu_count(), "params": params or {}, "rows": rows}
+    with open(_path(baseline_dir, name), "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    return _path(baseline_dir, name)
+
+
+def compare_baseline(name, rows, key="name", threshold=15.0, baseline_dir=BASELINE_DIR, params=None):
+    """행마다 지표 변화율(%)을 출력하고 threshold 를 넘게 나빠진 항목 수를 반환.
+
+    실행 조건(params)이 기준값과 다르면 비교하지 않고 None 을 반환한다.
+    """
+    path = _path(baseline_dir, name)
+    if not os.path.exists(path):
+        print(f"(기준값 없음: {path} — --save 로 먼저 저장)")
+        return 0
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    saved = doc.get("params", {})
+    if saved != (params or {}):
+        diff = {k: (saved.get(k), (params or {}).get(k)) for k in saved.keys() | (params or {}).keys()
+                if saved.get(k) != (params or {}).get(k)}
+        print(f"\n⚠️ 실행 조건이 기준값과 달라 비교하지 않음 (기준값, 현재): {diff}\n"
+              f"   같은 조건으로 다시 실행하거나 --save 로 기준값을 새로 저장하세요.")
+        return None
+    base = {r[key]: r for r in doc["rows"]}
+    regressions = 0
+    print(f"\n{'vs baseline':<28}{'metric':<20}{'base':>12}{'now':>12}{'diff':>9}")
+    for row in rows:
+        old = base.get(row[key])
+        if old is None:
+            print(f"{row[key]:<28}{'(new)':<20}")
+            continue
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            a, b = old.get(metric), row.get(metric)
+            if not a or b is None:
+                continue
+            pct = (b - a) / a * 100
+            worse = pct > threshold if metric in LOWER_IS_BETTER else pct < -threshold
+            worse = worse and abs(b - a) >= MIN_DELTA.get(metric, 0)
+            regressions += worse
+            flag = "  ❌" if worse else ""
+            print(f"{row[key]:<28}{metric:<20}{a:>12.3f}{b:>12.3f}{pct:>+8.1f}%{flag}")
+    for missing in base.keys() - {r[key] for r in rows}:
+        print(f"{missing:<28}{'(removed)':<20}")
+    return regressions
+
+
+def finish(name, rows, args, key="name", params=None):
+    # --save / --compare 처리 후 종료 코드 반환 (1: 회귀, 2: 실행 조건 불일치로 비교 불가)
+    code = 0
+    if args.compare:
+        bad = compare_baseline(name, rows, key, args.threshold, args.baseline_dir, params)
+        if bad is None:
+            code = 2
+        elif bad:
+            print(f"\n회귀 {bad}건 (>{args.threshold:.0f}%)")
+            code = 1
+    if args.save:
+        print(f"\n기준값 저장: {save_baseline(name, rows, args.baseline_dir, params)}")
+    return code
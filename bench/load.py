@@ -0,0 +1,139 @@
+"""동시 세션 부하 테스트 (오프라인).
+
+    python bench/load.py [--sessions 8] [--rounds 3] [--latency-ms 50] [--save | --compare]
+
+세션마다 converter.py 를 AppTest 로 띄워 8개 메뉴를 차례로 선택하고,
+도구별 시나리오(예보 조회, 치수 입력 등)를 실행한다. AppTest 는 한 프로세스 안에서
+동시에 여러 개를 돌릴 수 없으므로 세션 1개 = 워커 프로세스 1개로 동시에 실행하고,
+모든 워커가 같은 wttr.in 스텁 서버를 공유한다 (yfinance 는 워커마다 고정 데이터로 대체).
+rerun 지연 p50/p95/p99, 초당 rerun 수, 세션당 메모리 증가량을 도구별로 보고한다.
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# 앱 캐시 / 메트릭 파일이 작업 트리를 건드리지 않도록 core import 전에 지정
+os.environ.setdefault("TOOLBOX_CACHE_DIR", tempfile.mkdtemp(prefix="toolbox-bench-"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from bench.common import ROOT, add_baseline_args, finish, percentiles, rss_mb  # noqa: E402
+from bench.stubs import WttrStub, use_stubs  # noqa: E402
+from tools import TOOLS  # noqa: E402
+
+SITES = ["Atlanta, GA", "Dallas, TX", "Phoenix, AZ", "Denver, CO"]
+
+
+# --- 도구별 추가 동작 (메뉴 선택 rerun 이후) ---
+def _curing(at, i):
+    at.text_input(key="plan_loc").set_value(SITES[i % len(SITES)]).run()
+
+
+def _unit(at, i):
+    for w in at.text_input:
+        if w.label == "치수 입력":
+            w.set_value(f"{i % 20}' 4-1/2\"").run()
+            return
+
+
+SCENARIOS = {"curing": _curing, "unit": _unit}
+
+
+def session(idx, rounds, timings, errors):
+    # 세션 1개: rounds 번 x 8개 메뉴, rerun 마다 (도구, 초) 기록
+    at = AppTest.from_file(os.path.join(ROOT, "converter.py"), default_timeout=120)
+    t = time.perf_counter()
+    at.run()
+    timings["startup"].append(time.perf_counter() - t)
+    for r in range(rounds):
+        for label, mod in TOOLS.items():
+            steps = [lambda: at.sidebar.radio(key="menu").set_value(label).run()]
+            if mod in SCENARIOS:
+                steps.append(lambda: SCENARIOS[mod](at, idx + r))
+            for step in steps:
+                t = time.perf_counter()
+                step()
+                timings[mod].append(time.perf_counter() - t)
+                if at.exception:
+                    errors[mod] += 1
+    return at
+
+
+def _init_worker(wttr_url, cache_dir):
+    use_stubs(wttr_url, cache_dir)
+
+
+def worker(idx, rounds):
+    # 워커 프로세스: 워밍업 세션으로 import / 캐시를 채운 뒤 측정 세션 1개 실행
+    session(idx, 1, defaultdict(list), defaultdict(int))
+    gc.collect()
+    rss0 = rss_mb()
+    timings, errors = defaultdict(list), defaultdict(int)
+    t0 = time.time()
+    at = session(idx, rounds, timings, errors)
+    t1 = time.time()
+    gc.collect()
+    mem = rss_mb() - rss0
+    del at
+    return dict(timings), dict(errors), mem, t0, t1
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=8, help="동시 세션 수")
+    ap.add_argument("--rounds", type=int, default=3, help="세션당 전체 메뉴 순회 횟수")
+    ap.add_argument("--latency-ms", type=float, default=50.0, help="wttr.in 스텁 응답 지연")
+    add_baseline_args(ap)
+    args = ap.parse_args()
+
+    timings, errors, mems, spans = defaultdict(list), defaultdict(int), [], []
+    stub = WttrStub(args.latency_ms).start()
+    try:
+        with ProcessPoolExecutor(max_workers=args.sessions, initializer=_init_worker,
+                                 initargs=(stub.url, os.environ["TOOLBOX_CACHE_DIR"])) as pool:
+            futures = [pool.submit(worker, i, args.rounds) for i in range(args.sessions)]
+            for f in futures:
+                t, e, mem, t0, t1 = f.result()
+                for k, v in t.items():
+                    timings[k].extend(v)
+                for k, v in e.items():
+                    errors[k] += v
+                mems.append(mem)
+                spans.append((t0, t1))
+    finally:
+        stub.stop()
+    # 측정 구간이 겹친 전체 시간 기준 처리량
+    wall = max(t1 for _, t1 in spans) - min(t0 for t0, _ in spans)
+    mem = sum(mems) / len(mems)
+    upstream = stub.requests
+
+    rows = []
+    for name in ["startup", *TOOLS.values()]:
+        runs = timings.get(name, [])
+        rows.append({"name": name, "reruns": len(runs), "errors": errors.get(name, 0), **percentiles(runs)})
+    everything = [x for name in TOOLS.values() for x in timings.get(name, [])]
+    total = {"name": "ALL", "reruns": len(everything), "errors": sum(errors.values()), **percentiles(everything),
+             "reruns_per_s": round(len(everything) / wall, 2), "mem_mb_per_session": round(mem, 2)}
+    rows.append(total)
+
+    print(f"sessions={args.sessions} rounds={args.rounds} stub latency={args.latency_ms:g} ms "
+          f"wall={wall:.1f}s upstream wttr requests={upstream}")
+    print(f"{'tool':<12}{'reruns':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for r in rows:
+        print(f"{r['name']:<12}{r['reruns']:>8}{r['errors']:>8}{r['p50_ms'] or 0:>10.1f}{r['p95_ms'] or 0:>10.1f}"
+              f"{r['p99_ms'] or 0:>10.1f}")
+    print(f"throughput {total['reruns_per_s']:.1f} reruns/s · memory {total['mem_mb_per_session']:.1f} MB/session")
+    code = finish("load", rows, args,
+                  params={"sessions": args.sessions, "rounds": args.rounds, "latency_ms": args.latency_ms})
+    sys.exit(code or (1 if total["errors"] else 0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""도구별 콜드 스타트 벤치마크.
+
+    python bench/startup.py [--repeat 3] [--json out.json]
+
+도구마다 새 프로세스를 띄워
+  - import: streamlit 로딩 이후 tools.<모듈> import 에 걸린 시간
+  - first_render: AppTest 로 해당 메뉴를 선택한 채 converter.py 첫 실행에 걸린 시간
+  - heavy: 첫 렌더 후 로딩되어 있는 무거운 의존성
+을 측정한다. (생활/금융은 yfinance 네트워크 호출 시간이 포함됨)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tools import TOOLS  # noqa: E402
+
+HEAVY = ["pandas", "numpy", "requests", "pytz", "yfinance"]
+
+IMPORT_SNIPPET = """
+import importlib, sys, time
+sys.path.insert(0, {root!r})
+import streamlit
+t = time.perf_counter()
+importlib.import_module("tools.{mod}")
+print(time.perf_counter() - t)
+"""
+
+RENDER_SNIPPET = """
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+os.chdir({root!r})
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("converter.py", default_timeout=60)
+at.session_state["menu"] = {label!r}
+t = time.perf_counter()
+at.run()
+dt = time.perf_counter() - t
+print(json.dumps({{"first_render": dt, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _run(code):
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-1]
+
+
+def bench_tool(label, mod, repeat):
+    imports, renders, heavy = [], [], []
+    for _ in range(repeat):
+        imports.append(float(_run(IMPORT_SNIPPET.format(root=ROOT, mod=mod))))
+        res = json.loads(_run(RENDER_SNIPPET.format(root=ROOT, label=label, heavy=HEAVY)))
+        renders.append(res["first_render"])
+        heavy = res["heavy"]
+    return {"tool": label, "module": mod, "import_ms": statistics.median(imports) * 1000,
+            "first_render_ms": statistics.median(renders) * 1000, "heavy": heavy}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = ap.parse_args()
+
+    rows = [bench_tool(label, mod, args.repeat) for label, mod in TOOLS.items()]
+    print(f"{'tool':<12}{'import ms':>12}{'render ms':>12}  heavy deps")
+    for r in rows:
+        print(f"{r['module']:<12}{r['import_ms']:>12.1f}{r['first_render_ms']:>12.1f}  {', '.join(r['heavy']) or '-'}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""오프라인 벤치마크용 wttr.in / yfinance 대역.
+
+    with offline(latency_ms=50) as stub:
+        ...  # core.weather 는 로컬 HTTP 스텁, core.fx 는 고정 종가 사용
+        stub.requests  # 스텁이 받은 요청 수
+
+wttr.in 은 127.0.0.1 의 실제 HTTP 서버로 대체하므로 keep-alive / 단일 비행 /
+캐시 경로가 그대로 측정되고, yfinance 는 download_closes 만 결정적 데이터로 교체한다.
+"""
+import json
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+import numpy as np
+
+# 환율 대역 기준값 (USD 1 당)
+FX_BASE = {"KRW=X": 1380.0, "JPY=X": 150.0, "EUR=X": 0.92, "MXN=X": 17.5, "GBP=X": 0.78, "AUD=X": 1.52,
+           "SGD=X": 1.34, "AED=X": 3.67, "VND=X": 25400.0}
+
+
+def wttr_payload(location, days=3, start=None):
+    # wttr.in ?format=j1 의 필요한 부분만 — 위치 이름으로 시드를 정해 항상 같은 값
+    rng = np.random.default_rng(zlib.crc32(location.lower().encode()))
+    start = start or date.today()
+    base_t = rng.uniform(45, 95)
+    weather = []
+    for d in range(days):
+        hourly = []
+        for h in range(0, 24, 3):
+            t = base_t + 12 * np.sin((h - 9) / 24 * 2 * np.pi) + rng.normal(0, 2)
+            hourly.append({"time": str(h * 100), "tempF": f"{t:.0f}", "humidity": f"{rng.uniform(20, 90):.0f}",
+                           "windspeedMiles": f"{rng.uniform(0, 20):.0f}"})
+        weather.append({"date": (start + timedelta(days=d)).isoformat(), "hourly": hourly})
+    now = weather[0]["hourly"][4]
+    current = {"temp_F": now["tempF"], "humidity": now["humidity"], "windspeedMiles": now["windspeedMiles"],
+               "localObsDateTime": f"{start.isoformat()} 12:00 PM"}
+    return {"current_condition": [current], "weather": weather}
+
+
+def fake_closes(tickers, start=None):
+    # core.fx.download_closes 대역 — 최근 30 영업일 종가
+    end = date.today()
+    first = start or end - timedelta(days=42)
+    days = [d for d in (first + timedelta(days=i) for i in range((end - first).days + 1)) if d.weekday() < 5]
+    out = {}
+    for ticker in tickers:
+        rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+        base = FX_BASE.get(ticker, 1.0)
+        walk = base * np.exp(np.cumsum(rng.normal(0, 0.004, len(days))))
+        out[ticker] = [(d.isoformat(), float(v)) for d, v in zip(days, walk)]
+    return out
+
+
+class WttrStub:
+    """wttr.in 흉내를 내는 로컬 HTTP 서버 (요청마다 latency_ms 만큼 지연)."""
+
+    def __init__(self, latency_ms=0.0, port=0):
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                loc = unquote(urlparse(self.path).path.strip("/"))
+                body = json.dumps(wttr_payload(loc)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}/{{}}?format=j1"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True, name="wttr-stub").start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def use_stubs(wttr_url, cache_dir):
+    # 현재 프로세스의 core.weather / core.fx 를 대역으로 전환 (부하 테스트 워커 초기화용)
+    import core.fx
+    import core.weather
+
+    saved = core.weather.WTTR_URL, core.fx.download_closes, core.fx.HAS_YFINANCE, core.fx.CACHE_DIR
+    core.weather.WTTR_URL = wttr_url
+    core.fx.download_closes, core.fx.HAS_YFINANCE, core.fx.CACHE_DIR = fake_closes, True, cache_dir
+    return saved
+
+
+@contextmanager
+def offline(latency_ms=0.0):
+    """wttr.in → 로컬 스텁, yfinance → fake_closes, 캐시 디렉터리 → 임시 폴더."""
+    import core.fx
+    import core.weather
+
+    stub = WttrStub(latency_ms).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = use_stubs(stub.url, tmp)
+        stub.cache_dir = tmp
+        try:
+            yield stub
+        finally:
+            core.weather.WTTR_URL, core.fx.download_closes, core.fx.HAS_YFINANCE, core.fx.CACHE_DIR = saved
+            stub.stop()
+
+
+def main():
+    # 단독 실행: 스텁 서버만 띄움 (TOOLBOX_WTTR_URL 로 앱을 붙여 수동 테스트)
+    import argparse
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    args = ap.parse_args()
+    stub = WttrStub(args.latency_ms, args.port)
+    print(f"TOOLBOX_WTTR_URL='{stub.url}'")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
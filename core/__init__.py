@@ -0,0 +1 @@
+# Streamlit 없이 import 가능한 계산/데이터 엔진 모음
@@ -0,0 +1,47 @@
+"""CSV 를 청크 단위로 읽어 계산기를 적용하는 CLI.
+
+    python -m core.batch tray_fill takeoff.csv out.csv --map cable_dia_in=OD --chunksize 100000
+    cat takeoff.csv | python -m core.batch m3_to_yd3 - - > out.csv
+
+한 번에 chunksize 행만 메모리에 올리므로 입력 크기와 무관하게 메모리가 일정하다.
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from core.calc import CALCULATORS, apply_frame
+
+
+def run(name, src, dst, columns=None, chunksize=100_000):
+    rows = 0
+    header = True
+    for chunk in pd.read_csv(src, chunksize=chunksize):
+        apply_frame(name, chunk, columns).to_csv(dst, header=header, index=False)
+        header = False
+        rows += len(chunk)
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m core.batch", description="CSV 배치 계산")
+    ap.add_argument("calculator", choices=sorted(CALCULATORS))
+    ap.add_argument("input", help="입력 CSV (- = stdin)")
+    ap.add_argument("output", help="출력 CSV (- = stdout)")
+    ap.add_argument("--map", action="append", default=[], metavar="INPUT=COLUMN",
+                    help="계산기 입력 이름과 CSV 컬럼명이 다를 때 매핑")
+    ap.add_argument("--chunksize", type=int, default=100_000)
+    args = ap.parse_args(argv)
+
+    columns = dict(m.split("=", 1) for m in args.map)
+    src = sys.stdin if args.input == "-" else args.input
+    if args.output == "-":
+        rows = run(args.calculator, src, sys.stdout, columns, args.chunksize)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as dst:
+            rows = run(args.calculator, src, dst, columns, args.chunksize)
+    print(f"{rows:,} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
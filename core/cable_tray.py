@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from core.calc import TRAY_FILL_LIMIT
+
+# 표준 트레이 규격 (inch) — NEMA VE 1
+TRAY_WIDTHS = [6, 9, 12, 18, 24, 30, 36]
+TRAY_DEPTHS = [4, 6]
+FILL_LABELS = ("✅ 적합 (OK)", "🚫 트레이 없음 (No Tray)", "❌ 초과 (Over)")
+
+
+def _tray_sizes():
+    # (폭, 깊이, 단면적) 을 단면적 → 폭 순으로 정렬
+    sizes = sorted(((w, d) for w in TRAY_WIDTHS for d in TRAY_DEPTHS), key=lambda x: (x[0] * x[1], x[0]))
+    w, d = np.array(sizes).T
+    return w, d, w * d
+
+
+def cable_area(dia_in):
+    return np.pi * (np.asarray(dia_in, dtype=float) / 2) ** 2
+
+
+# ==========================================
+# ⚡ 구간별 채움률 (벡터화)
+# ==========================================
+def segment_fill(cables, trays=None, limit=TRAY_FILL_LIMIT):
+    """케이블 스케줄(segment, dia_in) → 트레이 구간별 채움률.
+
+    trays(segment, width_in, depth_in) 가 주어지면 실제 트레이 기준으로 채움률과
+    초과(over) 여부를 계산한다. 트레이 행이 없는 구간은 no_tray 로 따로 표시한다
+    (채움률 nan 이 적합으로 보이지 않도록).
+    """
+    codes, segments = pd.factorize(cables["segment"], sort=True)
+    area = np.bincount(codes, weights=cable_area(cables["dia_in"].to_numpy()), minlength=len(segments))
+    count = np.bincount(codes, minlength=len(segments))
+    out = pd.DataFrame({"segment": segments, "n_cables": count, "cable_area": area})
+    if trays is not None:
+        out = out.merge(trays[["segment", "width_in", "depth_in"]], on="segment", how="left")
+        out["fill_pct"] = out["cable_area"] / (out["width_in"] * out["depth_in"]) * 100
+        out["over"] = out["fill_pct"] > limit
+        out["no_tray"] = out["width_in"].isna() | out["depth_in"].isna()
+        out["status"] = np.select([out["no_tray"], out["over"]], FILL_LABELS[1:], FILL_LABELS[0])
+    return out
+
+
+# ==========================================
+# 📦 최소 트레이 선정 (Bin packing)
+# ==========================================
+def size_trays(cables, limit=TRAY_FILL_LIMIT):
+    """구간마다 채움률 limit 을 만족하는 가장 작은 표준 트레이를 선정.
+
+    - 한 개 트레이로 충분한 구간: 허용 단면적 배열에 searchsorted (전 구간 한 번에)
+    - 가장 큰 트레이로도 초과하는 구간: 굵은 케이블부터 First-Fit Decreasing 으로
+      병렬 트레이에 나눠 담은 뒤 각 트레이를 다시 최소 규격으로 축소
+    반환: (트레이 계획 DataFrame, 케이블별 tray_no 배열)
+    """
+    widths, depths, areas = _tray_sizes()
+    cap = areas * limit / 100
+    codes, segments = pd.factorize(cables["segment"], sort=True)
+    a = cable_area(cables["dia_in"].to_numpy())
+    seg_area = np.bincount(codes, weights=a, minlength=len(segments))
+    tray_no = np.zeros(len(cables), dtype=int)
+
+    fits = seg_area <= cap[-1]
+    pick = np.searchsorted(cap, seg_area[fits])
+    plan = [pd.DataFrame({"segment": segments[fits], "tray_no": 0, "size_idx": pick, "cable_area": seg_area[fits]})]
+
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(segments) + 1))
+    for s in np.flatnonzero(~fits):
+        members = order[bounds[s]:bounds[s + 1]]
+        members = members[np.argsort(-a[members], kind="stable")]
+        free = []
+        for i in members:
+            # 단일 케이블이 최대 트레이를 넘으면 혼자 한 트레이 (초과로 표시됨)
+            k = next((j for j, f in enumerate(free) if f >= a[i]), None)
+            if k is None:
+                free.append(cap[-1])
+                k = len(free) - 1
+            free[k] -= a[i]
+            tray_no[i] = k
+        used = cap[-1] - np.array(free)
+        plan.append(pd.DataFrame({"segment": segments[s], "tray_no": np.arange(len(free)),
+                                  "size_idx": np.minimum(np.searchsorted(cap, used), len(cap) - 1),
+                                  "cable_area": used}))
+
+    plan = pd.concat(plan, ignore_index=True)
+    idx = np.minimum(plan.pop("size_idx").to_numpy(), len(cap) - 1)
+    plan["width_in"], plan["depth_in"] = widths[idx], depths[idx]
+    plan["fill_pct"] = plan["cable_area"] / areas[idx] * 100
+    plan["over"] = plan["fill_pct"] > limit
+    return plan.sort_values(["segment", "tray_no"], ignore_index=True), tray_no
@@ -0,0 +1,120 @@
+import numpy as np
+
+from core.catalog import get_catalog
+
+# ==========================================
+# 🧮 현장 계산식 (Streamlit 없이 사용 가능)
+# ==========================================
+# 모든 함수는 스칼라와 배열(NumPy/pandas) 입력을 모두 받는다.
+# pandas 는 배열 라벨 매핑에서만 필요하므로 그때 import (단위 변환 화면 콜드 스타트 절약)
+
+# 배관 구배 (inch / ft)
+SLOPES = {"1/8": 0.125, "1/4": 0.25, "1/2": 0.5, "1": 1.0}
+
+TRAY_FILL_LIMIT = 40.0  # %
+TAX_FREE = 14600  # 단순화된 세율 계산용 공제액 ($)
+TAX_RATE = 0.22
+
+MM_PER_IN = 25.4
+MM_PER_FT = 304.8
+YD3_PER_M3 = 1 / 0.9144 ** 3  # 1.30795
+
+
+def _keys(*cols):
+    # 여러 컬럼을 브로드캐스트 후 문자열 키로 결합
+    import pandas as pd
+
+    cols = np.broadcast_arrays(*[np.asarray(c, dtype=object) for c in cols])
+    series = [pd.Series(c.ravel()).astype(str).str.strip() for c in cols]
+    key = series[0]
+    for s in series[1:]:
+        key = key + "|" + s
+    return key, cols[0].shape
+
+
+def bolt_torque(size, grade):
+    # 볼트 적정 토크 (ft-lbs) — data/bolts.csv 카탈로그 기준
+    torque = get_catalog().torque_map()
+    if np.ndim(size) == 0 and np.ndim(grade) == 0:
+        return torque.get((grade, size), 0)
+    table = {f"{g}|{s}": v for (g, s), v in torque.items()}
+    key, shape = _keys(grade, size)
+    return key.map(table).to_numpy(dtype=float).reshape(shape)  # 없는 규격은 nan
+
+
+def slope_in_per_ft(slope):
+    # "1/4" 같은 구배 라벨 또는 숫자 (inch/ft)
+    if np.ndim(slope) == 0:
+        return SLOPES[slope] if slope in SLOPES else float(slope)
+    import pandas as pd
+
+    s = pd.Series(np.asarray(slope, dtype=object).ravel()).astype(str).str.strip()
+    return s.map(SLOPES).fillna(pd.to_numeric(s, errors="coerce")).to_numpy().reshape(np.shape(slope))
+
+
+def pipe_drop(length_ft, slope):
+    # 높이 차이 (inch)
+    return np.multiply(length_ft, slope_in_per_ft(slope))
+
+
+def load_moment(weight_lbs, radius_ft):
+    # lbs-ft
+    return np.multiply(weight_lbs, radius_ft)
+
+
+def tray_fill(width_in, depth_in, cable_dia_in, count):
+    # 채움률 (%)
+    return np.pi * (np.asarray(cable_dia_in) / 2) ** 2 * count / np.multiply(width_in, depth_in) * 100
+
+
+def overtime_cost(people, rate_hr, hours, multiplier=1.5):
+    return np.asarray(people) * rate_hr * hours * multiplier
+
+
+def net_salary(salary):
+    # 연 실수령액 ($, 단순화된 세율)
+    salary = np.asarray(salary, dtype=float)
+    return salary - np.maximum(0, salary - TAX_FREE) * TAX_RATE
+
+
+def tip_per_person(bill, tip_pct, people=1):
+    return np.asarray(bill) * (1 + np.asarray(tip_pct) / 100) / people
+
+
+def mm_to_ft(mm):
+    return np.asarray(mm) / MM_PER_FT
+
+
+def ft_to_mm(ft):
+    return np.asarray(ft) * MM_PER_FT
+
+
+def m3_to_yd3(m3):
+    return np.asarray(m3) * YD3_PER_M3
+
+
+# --- 배치 계산기 레지스트리 ---
+# 이름 → (함수, 입력 컬럼, 출력 컬럼)
+CALCULATORS = {
+    "bolt_torque": (bolt_torque, ["size", "grade"], "torque_ft_lbs"),
+    "pipe_drop": (pipe_drop, ["length_ft", "slope"], "drop_in"),
+    "load_moment": (load_moment, ["weight_lbs", "radius_ft"], "moment_lbs_ft"),
+    "tray_fill": (tray_fill, ["width_in", "depth_in", "cable_dia_in", "count"], "fill_pct"),
+    "overtime": (overtime_cost, ["people", "rate_hr", "hours", "multiplier"], "cost"),
+    "net_salary": (net_salary, ["salary"], "net_salary"),
+    "tip": (tip_per_person, ["bill", "tip_pct", "people"], "per_person"),
+    "mm_to_ft": (mm_to_ft, ["mm"], "ft"),
+    "ft_to_mm": (ft_to_mm, ["ft"], "mm"),
+    "m3_to_yd3": (m3_to_yd3, ["m3"], "yd3"),
+}
+
+
+def apply_frame(name, df, columns=None):
+    """df 의 컬럼들로 계산기를 한 번에 실행하고 결과 컬럼을 붙여 반환.
+
+    columns: 입력 이름 → df 컬럼명 매핑 (기본은 입력 이름 그대로)
+    """
+    func, inputs, output = CALCULATORS[name]
+    columns = columns or {}
+    args = [df[columns.get(i, i)].to_numpy() for i in inputs]
+    return df.assign(**{output: func(*args)})
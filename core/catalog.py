@@ -0,0 +1,98 @@
+import csv
+import functools
+import json
+import os
+import sqlite3
+import threading
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def _read_csv(data_dir, name):
+    with open(os.path.join(data_dir, name), newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+# ==========================================
+# 📚 엔지니어링 참조 카탈로그
+# ==========================================
+class Catalog:
+    """data/ 의 볼트·소켓·JHA 표 (+ JHA 작업 패키지 템플릿) 를 프로세스당 1번 읽어 색인.
+
+    - 볼트/소켓/JHA 단건 조회: dict 인덱스 (O(1))
+    - JHA 검색: 인메모리 SQLite FTS5 (trigram, 부분 문자열 검색)
+    """
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.bolts = [dict(r, dia_in=float(r["dia_in"]), pretension_kips=float(r["pretension_kips"]),
+                           pretension_kn=float(r["pretension_kn"]), torque_ft_lbs=int(r["torque_ft_lbs"]))
+                      for r in _read_csv(data_dir, "bolts.csv")]
+        self._bolt = {(r["grade"], r["size"]): r for r in self.bolts}
+        self.sockets = sorted(({**r, "size_mm": float(r["size_mm"])} for r in _read_csv(data_dir, "sockets.csv")),
+                              key=lambda r: (r["system"], r["size_mm"]))
+        with open(os.path.join(data_dir, "jha.json"), encoding="utf-8") as f:
+            self.jha_tasks = json.load(f)
+        self._jha = {t["task"]: t for t in self.jha_tasks}
+        with open(os.path.join(data_dir, "jha_templates.json"), encoding="utf-8") as f:
+            templates = json.load(f)
+        self.jha_baseline = templates["baseline"]
+        self.jha_packages = templates["packages"]
+        self._lock = threading.Lock()
+        self._db = self._build_index()
+
+    def _build_index(self):
+        db = sqlite3.connect(":memory:", check_same_thread=False)
+        try:
+            db.execute("CREATE VIRTUAL TABLE jha USING fts5(task, category, hazards, controls, tokenize='trigram')")
+            self._fts = True
+        except sqlite3.OperationalError:  # trigram 미지원 SQLite (< 3.34)
+            db.execute("CREATE TABLE jha (task, category, hazards, controls)")
+            self._fts = False
+        db.executemany("INSERT INTO jha VALUES (?, ?, ?, ?)",
+                       [(t["task"], t["category"], ", ".join(t["hazards"]), "\n".join(t["controls"]))
+                        for t in self.jha_tasks])
+        return db
+
+    # --- 볼트 ---
+    def bolt_grades(self):
+        return list(dict.fromkeys(r["grade"] for r in self.bolts))
+
+    def bolt_sizes(self, grade):
+        return [r["size"] for r in self.bolts if r["grade"] == grade]
+
+    def bolt(self, grade, size):
+        return self._bolt.get((grade, size))
+
+    def torque_map(self):
+        return {k: r["torque_ft_lbs"] for k, r in self._bolt.items()}
+
+    # --- 소켓 ---
+    def socket_sizes(self, system):
+        return [r for r in self.sockets if r["system"] == system]
+
+    # --- JHA ---
+    def jha(self, task):
+        return self._jha.get(task)
+
+    def jha_categories(self):
+        return list(dict.fromkeys(t["category"] for t in self.jha_tasks))
+
+    def search_jha(self, query, limit=50):
+        query = query.strip()
+        if not query:
+            return self.jha_tasks[:limit]
+        with self._lock:
+            if self._fts and len(query) >= 3:
+                rows = self._db.execute("SELECT task FROM jha WHERE jha MATCH ? ORDER BY rank LIMIT ?",
+                                        ('"' + query.replace('"', '""') + '"', limit)).fetchall()
+            else:
+                like = f"%{query}%"
+                rows = self._db.execute("SELECT task FROM jha WHERE task LIKE ? OR category LIKE ? OR hazards LIKE ? "
+                                        "OR controls LIKE ? LIMIT ?", (like, like, like, like, limit)).fetchall()
+        return [self._jha[r[0]] for r in rows]
+
+
+@functools.lru_cache(maxsize=None)
+def get_catalog():
+    # 프로세스 단위 싱글턴
+    return Catalog()
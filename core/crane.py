@@ -0,0 +1,114 @@
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+from core.catalog import DATA_DIR
+
+CRITICAL_PCT = 75.0  # 정격 대비 75% 초과 → Critical Lift (인양 계획서 필요)
+
+STATUS_LABELS = {0: "✅ 적합 (OK)", 1: "⚠️ Critical Lift", 2: "❌ 초과 (Over)", 3: "🚫 차트 범위 밖"}
+
+
+def _axis(grid, x):
+    # 정렬된 격자에서 x 의 하단 인덱스, 상단 인덱스, 보간 비율, 범위 내 여부
+    x = np.asarray(x, dtype=float)
+    i0 = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 1)
+    i1 = np.minimum(i0 + 1, len(grid) - 1)
+    span = grid[i1] - grid[i0]
+    t = np.where(span > 0, (x - grid[i0]) / np.where(span > 0, span, 1), 0.0)
+    inside = (x >= grid[0]) & (x <= grid[-1])
+    return i0, i1, np.clip(t, 0, 1), inside
+
+
+# ==========================================
+# 🏗️ 크레인 정격 하중표
+# ==========================================
+class LoadChart:
+    """붐 길이 x 작업 반경 정격 하중 격자 (float32 배열, 허용되지 않는 칸은 nan)."""
+
+    def __init__(self, booms, radii, capacity):
+        self.booms = np.asarray(booms, dtype=float)
+        self.radii = np.asarray(radii, dtype=float)
+        self.capacity_grid = np.asarray(capacity, dtype=np.float32)
+
+    @classmethod
+    def from_frame(cls, df):
+        grid = df.pivot_table(index="boom_ft", columns="radius_ft", values="capacity_lbs", aggfunc="min")
+        return cls(grid.index.to_numpy(), grid.columns.to_numpy(), grid.to_numpy())
+
+    def capacity(self, boom_ft, radius_ft, method="bilinear"):
+        """정격 하중 (lbs). 배열 입력 가능.
+
+        bilinear: 주변 4개 격자점 쌍선형 보간
+        conservative: 보간에 쓰이는 격자점 중 최소값 (현장 관행: 보간 대신 불리한 쪽 사용)
+        차트 범위 밖이거나 필요한 격자점이 비어 있으면 nan
+        """
+        b0, b1, tb, in_b = _axis(self.booms, boom_ft)
+        r0, r1, tr, in_r = _axis(self.radii, radius_ft)
+        g = self.capacity_grid
+        corners = np.stack([g[b0, r0], g[b0, r1], g[b1, r0], g[b1, r1]]).astype(float)
+        weights = np.stack([(1 - tb) * (1 - tr), (1 - tb) * tr, tb * (1 - tr), tb * tr])
+        used = weights > 0
+        missing = (used & np.isnan(corners)).any(axis=0)
+        if method == "conservative":
+            cap = np.where(used, corners, np.inf).min(axis=0)
+        else:
+            cap = (np.where(used, corners, 0) * weights).sum(axis=0)
+        return np.where(in_b & in_r & ~missing, cap, np.nan)
+
+
+def utilization(load_lbs, capacity_lbs):
+    # 사용률 (%) 과 상태 코드
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.asarray(load_lbs, dtype=float) / capacity_lbs * 100
+    status = np.select([np.isnan(pct), pct > 100, pct > CRITICAL_PCT], [3, 2, 1], 0)
+    return pct, status
+
+
+class ChartIndex:
+    """(크레인, 구성) → LoadChart 인덱스."""
+
+    def __init__(self, frame):
+        self.charts = {key: LoadChart.from_frame(g) for key, g in frame.groupby(["crane", "config"], sort=False)}
+
+    def cranes(self):
+        return list(dict.fromkeys(c for c, _ in self.charts))
+
+    def configs(self, crane):
+        return [cfg for c, cfg in self.charts if c == crane]
+
+    def chart(self, crane, config):
+        return self.charts[(crane, config)]
+
+    def check_lifts(self, plan, method="conservative"):
+        """인양 계획 (crane, config, boom_ft, radius_ft, load_lbs[, rigging_lbs]) 전체를 한 번에 검토.
+
+        (크레인, 구성) 그룹마다 배열 보간을 한 번씩만 수행한다.
+        안전 판정이므로 기본은 보수적 정격 하중 (보간값은 불리한 쪽보다 클 수 있음).
+        """
+        out = plan.copy()
+        # 숫자가 아닌 값은 nan → 해당 행만 "차트 범위 밖" (계획 전체가 실패하지 않도록)
+        # 리깅 무게는 빈 칸만 0 으로 본다
+        if "rigging_lbs" in out:
+            out["rigging_lbs"] = out["rigging_lbs"].where(out["rigging_lbs"].notna(), 0)
+        for c in ("boom_ft", "radius_ft", "load_lbs", "rigging_lbs"):
+            if c in out:
+                out[c] = pd.to_numeric(out[c], errors="coerce")
+        total = out["load_lbs"] + (out["rigging_lbs"] if "rigging_lbs" in out else 0)
+        cap = np.full(len(out), np.nan)
+        for (crane, config), idx in out.groupby(["crane", "config"], sort=False).indices.items():
+            chart = self.charts.get((crane, config))
+            if chart is not None:
+                cap[idx] = chart.capacity(out["boom_ft"].to_numpy()[idx], out["radius_ft"].to_numpy()[idx], method)
+        pct, status = utilization(total.to_numpy(), cap)
+        out["capacity_lbs"], out["utilization_pct"] = cap, pct
+        out["status"] = pd.Series(status, index=out.index).map(STATUS_LABELS)
+        return out
+
+
+@functools.lru_cache(maxsize=None)
+def get_charts(path=None):
+    # 프로세스당 1번 로딩 — 기본은 예시 차트 (실제 양중 계획에는 제조사 차트로 교체)
+    return ChartIndex(pd.read_csv(path or os.path.join(DATA_DIR, "crane_charts.csv")))
@@ -0,0 +1,90 @@
+import numpy as np
+
+# 온도 조건 코드: -1 한중 / 0 적정 / 1 서중 (ACI 306R 40°F, ACI 305R 90°F)
+COLD_F, HOT_F = 40.0, 90.0
+TEMP_LABELS = {-1: "❄️ 한중 (Cold)", 0: "✅ 적정 (Good)", 1: "🔥 서중 (Hot)"}
+
+# 균열 위험 코드: 0 안전 / 1 주의 / 2 위험 (lb/ft²/hr)
+CAUTION_E, CRITICAL_E = 0.1, 0.2
+RISK_LABELS = {0: "✅ 안전 (Safe)", 1: "⚠️ 주의 (Caution)", 2: "🚨 위험 (Critical)"}
+
+
+# --- 증발률 (ACI 305R Menzel 식, 벡터화) ---
+def evaporation_rate(temp_f, rh, v_mph, conc_f=None):
+    # 배열 입력 → 배열 출력. 콘크리트 온도를 모르면 기온과 같다고 가정
+    temp_f = np.asarray(temp_f, dtype=float)
+    conc_f = temp_f if conc_f is None else np.asarray(conc_f, dtype=float)
+    rh = np.asarray(rh, dtype=float)
+    v_mph = np.asarray(v_mph, dtype=float)
+    tc = np.maximum(conc_f + 18, 0) ** 2.5
+    ta = np.maximum(temp_f + 18, 0) ** 2.5
+    e = 5 * (tc - (rh / 100) * ta) * (v_mph + 4) * 1e-6
+    return np.maximum(np.nan_to_num(e), 0)
+
+
+def calc_evaporation_rate(tc, rh, v_mph):
+    # 기존 스칼라 API (기온 °C)
+    return float(evaporation_rate(tc * 9 / 5 + 32, rh, v_mph))
+
+
+def temp_class_codes(temp_f):
+    temp_f = np.asarray(temp_f, dtype=float)
+    return np.where(temp_f < COLD_F, -1, np.where(temp_f > HOT_F, 1, 0))
+
+
+def risk_codes(evap):
+    evap = np.asarray(evap, dtype=float)
+    return (evap > CAUTION_E).astype(int) + (evap > CRITICAL_E)
+
+
+def temp_class(temp_f):
+    return TEMP_LABELS[int(temp_class_codes(temp_f))]
+
+
+def evap_risk(evap_rate):
+    return RISK_LABELS[int(risk_codes(evap_rate))]
+
+
+# ==========================================
+# ⏱️ 타설 시간 계획 (시간별 예보)
+# ==========================================
+def score_forecast(temp_f, rh, v_mph):
+    """예보 배열(현장 x 시간 또는 1차원)을 한 번에 평가.
+
+    반환: (증발률, 온도 코드, 위험 코드, 저위험 여부)
+    저위험 = 적정 온도 & 안전 증발률 (값이 없는 nan 칸은 저위험이 아님)
+    """
+    evap = evaporation_rate(temp_f, rh, v_mph)
+    tcode = temp_class_codes(temp_f)
+    rcode = risk_codes(evap)
+    valid = np.isfinite(np.asarray(temp_f, dtype=float) + np.asarray(rh, dtype=float) + np.asarray(v_mph, dtype=float))
+    return evap, tcode, rcode, (tcode == 0) & (rcode == 0) & valid
+
+
+def best_pour_windows(evap, ok, width):
+    """연속 width 스텝이 모두 저위험인 구간 중 평균 증발률이 가장 낮은 구간.
+
+    evap/ok 는 (현장, 시간) 2차원 (1차원이면 현장 1개).
+    누적합으로 모든 시작점의 구간 합을 한 번에 구하는 슬라이딩 윈도우.
+    반환: (시작 인덱스, 평균 증발률) 배열 — 구간이 없으면 -1 / nan
+    """
+    evap = np.atleast_2d(np.asarray(evap, dtype=float))
+    ok = np.atleast_2d(np.asarray(ok, dtype=bool))
+    rows, n = evap.shape
+    if width < 1 or width > n:
+        return np.full(rows, -1), np.full(rows, np.nan)
+    ce = np.pad(np.cumsum(evap, axis=1), ((0, 0), (1, 0)))
+    co = np.pad(np.cumsum(ok, axis=1), ((0, 0), (1, 0)))
+    mean_e = (ce[:, width:] - ce[:, :-width]) / width
+    all_ok = (co[:, width:] - co[:, :-width]) == width
+    scores = np.where(all_ok, mean_e, np.inf)
+    start = scores.argmin(axis=1)
+    best = scores[np.arange(rows), start]
+    found = np.isfinite(best)
+    return np.where(found, start, -1), np.where(found, best, np.nan)
+
+
+def low_risk_runs(ok):
+    # 1차원 bool 배열의 연속 True 구간 [(start, end_exclusive), ...]
+    edges = np.diff(np.concatenate(([0], np.asarray(ok, dtype=np.int8), [0])))
+    return list(zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()))
@@ -0,0 +1,159 @@
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+
+from core.metrics import METRICS
+
+# yfinance 안전 로딩
+try:
+    import yfinance as yf
+
+    HAS_YFINANCE = True
+except ImportError:
+    HAS_YFINANCE = False
+
+# 통화 → 야후 티커 (1 USD 당 해당 통화)
+PAIRS = {"KRW": "KRW=X", "JPY": "JPY=X", "EUR": "EUR=X", "MXN": "MXN=X", "GBP": "GBP=X", "AUD": "AUD=X",
+         "SGD": "SGD=X", "AED": "AED=X", "VND": "VND=X"}
+
+CACHE_DIR = os.environ.get("TOOLBOX_CACHE_DIR",
+                           os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fx_rates (ccy TEXT, day TEXT, close REAL, PRIMARY KEY (ccy, day));
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL);
+"""
+
+
+def download_closes(tickers, start=None):
+    # 여러 티커를 한 번의 yf.download 로 → {ticker: [(day, close), ...]}
+    kw = {"start": start.isoformat()} if start else {"period": "1mo"}
+    data = yf.download(list(tickers), interval="1d", auto_adjust=True, progress=False, threads=True, **kw)
+    if data is None or data.empty:
+        return {}
+    close = data["Close"]
+    if not hasattr(close, "columns"):  # 티커 1개면 Series
+        close = close.to_frame(tickers[0])
+    out = {}
+    for ticker in close.columns:
+        s = close[ticker].dropna()
+        out[ticker] = [(ts.date().isoformat(), float(v)) for ts, v in s.items()]
+    return out
+
+
+# ==========================================
+# 💱 환율 디스크 캐시 (프로세스 간 공유)
+# ==========================================
+class FxStore:
+    """SQLite 파일에 일별 종가를 쌓아두는 환율 캐시.
+
+    워커 프로세스들이 같은 파일을 공유하고 재시작 후에도 유지된다.
+    refresh() 는 min_interval 마다 한 프로세스만 실제로 다운로드하며,
+    이미 가진 마지막 날짜 이후 봉만 받아온다.
+    """
+
+    def __init__(self, path=None, pairs=PAIRS):
+        self.path = path or os.path.join(CACHE_DIR, "fx.sqlite3")
+        self.pairs = dict(pairs)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        db = self._connect()
+        try:
+            db.executescript(SCHEMA)
+        finally:
+            db.close()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        return db
+
+    def _meta(self, db, key):
+        row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _claim_refresh(self, min_interval):
+        # 다른 프로세스가 최근에 갱신을 시작했으면 False
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            last = self._meta(db, "last_attempt")
+            now = time.time()
+            if last is not None and now - last < min_interval:
+                db.execute("ROLLBACK")
+                return False
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('last_attempt', ?)", (now,))
+            db.execute("COMMIT")
+            return True
+        finally:
+            db.close()
+
+    def _retry_in(self, seconds, min_interval):
+        # 실패 시 min_interval 대신 seconds 뒤에 다시 시도하도록 당겨둠
+        db = self._connect()
+        try:
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('last_attempt', ?)",
+                       (time.time() - min_interval + seconds,))
+        finally:
+            db.close()
+
+    def last_days(self):
+        db = self._connect()
+        try:
+            rows = db.execute("SELECT ccy, MAX(day) FROM fx_rates GROUP BY ccy").fetchall()
+        finally:
+            db.close()
+        return {ccy: date.fromisoformat(day) for ccy, day in rows}
+
+    def refresh(self, min_interval=3600, retry_after=300):
+        if not HAS_YFINANCE or not self._claim_refresh(min_interval):
+            return False
+        last = self.last_days()
+        if all(ccy in last for ccy in self.pairs):
+            # 마지막 봉은 장중에 바뀔 수 있으므로 다시 받음
+            start = min(last[ccy] for ccy in self.pairs)
+        else:
+            start = None
+        try:
+            with METRICS.track("upstream_seconds", service="yfinance"):
+                closes = download_closes(list(self.pairs.values()), start)
+        except Exception:
+            closes = {}
+        by_ticker = {t: ccy for ccy, t in self.pairs.items()}
+        rows = [(by_ticker[t], day, v) for t, bars in closes.items() if t in by_ticker for day, v in bars]
+        if not rows:
+            self._retry_in(retry_after, min_interval)
+            return False
+        db = self._connect()
+        try:
+            db.execute("BEGIN")
+            db.executemany("INSERT OR REPLACE INTO fx_rates VALUES (?, ?, ?)", rows)
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('last_success', ?)", (time.time(),))
+            db.execute("COMMIT")
+        finally:
+            db.close()
+        return True
+
+    def latest(self):
+        # {ccy: {"rate", "as_of" (봉 날짜), "fetched_at" (epoch)}} — 데이터가 없는 통화는 빠짐
+        db = self._connect()
+        try:
+            rows = db.execute("""
+                SELECT f.ccy, f.day, f.close FROM fx_rates f
+                JOIN (SELECT ccy, MAX(day) AS day FROM fx_rates GROUP BY ccy) m
+                  ON f.ccy = m.ccy AND f.day = m.day
+            """).fetchall()
+            fetched_at = self._meta(db, "last_success")
+        finally:
+            db.close()
+        return {ccy: {"rate": close, "as_of": date.fromisoformat(day), "fetched_at": fetched_at}
+                for ccy, day, close in rows if ccy in self.pairs}
+
+    def history(self, ccy, days=30):
+        since = (date.today() - timedelta(days=days)).isoformat()
+        db = self._connect()
+        try:
+            return db.execute("SELECT day, close FROM fx_rates WHERE ccy = ? AND day >= ? ORDER BY day",
+                              (ccy, since)).fetchall()
+        finally:
+            db.close()
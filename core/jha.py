@@ -0,0 +1,259 @@
+import csv
+import functools
+import html
+import io
+import logging
+import multiprocessing
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from core.catalog import get_catalog
+
+# PDF 출력 안전 로딩 (fpdf2 + 한글 TTF 폰트가 있어야 사용 가능)
+try:
+    from fpdf import FPDF
+
+    HAS_FPDF = True
+    logging.getLogger("fontTools.subset").setLevel(logging.ERROR)  # 폰트 서브셋 경고 억제
+except ImportError:
+    HAS_FPDF = False
+
+FONT_CANDIDATES = [
+    os.environ.get("TOOLBOX_PDF_FONT", ""),
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/Library/Fonts/NanumGothic.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+]
+FORMATS = ("html", "pdf", "csv")
+CSV_COLUMNS = ["date", "crew", "location", "foreman", "category", "task", "kind", "no", "item"]
+POOL_MIN = 40  # PDF 포함 시 이 이상 패키지면 프로세스 풀로 렌더링
+
+CSS = """
+body { font-family: 'Malgun Gothic', 'Apple SD Gothic Neo', 'Nanum Gothic', sans-serif; font-size: 12px; margin: 24px; }
+h1 { font-size: 18px; border-bottom: 2px solid #333; } h2 { font-size: 14px; margin: 14px 0 4px; }
+table { border-collapse: collapse; width: 100%; } td, th { border: 1px solid #999; padding: 4px 6px; text-align: left; }
+.meta td { border: none; padding: 2px 8px 2px 0; } .hz { color: #b00; } .sign td { height: 28px; }
+.jha { page-break-after: always; } .jha:last-child { page-break-after: auto; }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def pdf_font():
+    # 사용 가능한 한글 TTF 경로 (없으면 None)
+    return next((p for p in FONT_CANDIDATES if p and os.path.exists(p)), None)
+
+
+def pdf_available():
+    return HAS_FPDF and pdf_font() is not None
+
+
+# ==========================================
+# 🧩 작업 패키지 구성
+# ==========================================
+def expand_tasks(items):
+    """작업명 / 패키지 템플릿명 목록 → 중복 없는 작업명 tuple. 모르는 이름은 ValueError."""
+    catalog = get_catalog()
+    tasks, unknown = [], []
+    for name in items:
+        name = name.strip()
+        if not name:
+            continue
+        if name in catalog.jha_packages:
+            tasks.extend(catalog.jha_packages[name])
+        elif catalog.jha(name):
+            tasks.append(name)
+        else:
+            unknown.append(name)
+    if unknown:
+        raise ValueError(f"알 수 없는 작업: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(tasks))
+
+
+def load_plan(records):
+    """일일 작업계획 행 (date, crew, tasks[, location, foreman]) → 작업 패키지 목록.
+
+    tasks 는 ';' 로 구분한 작업명 또는 템플릿명. 같은 (date, crew, location, foreman) 행은 하나로 합친다.
+    """
+    packages = {}
+    for r in records:
+        key = tuple(str(r.get(k) or "").strip() for k in ("date", "crew", "location", "foreman"))
+        packages.setdefault(key, []).extend(re.split(r"[;\n]", str(r["tasks"])))
+    return [dict(zip(("date", "crew", "location", "foreman"), k), tasks=expand_tasks(v)) for k, v in packages.items()]
+
+
+@functools.lru_cache(maxsize=4096)
+def compose(tasks):
+    """여러 작업의 위험요인 / 대책을 합침 (순서 유지, 중복 제거, 출처 작업 기록)."""
+    catalog = get_catalog()
+    hazards, controls = {}, {}
+    for task in tasks:
+        jha = catalog.jha(task)
+        for h in jha["hazards"]:
+            hazards.setdefault(h, []).append(task)
+        for c in jha["controls"]:
+            controls.setdefault(c, []).append(task)
+    return {"tasks": tasks, "hazards": [(h, tuple(src)) for h, src in hazards.items()],
+            "controls": [(c, tuple(src)) for c, src in controls.items()]}
+
+
+# ==========================================
+# 📄 섹션 렌더링 (작업 단위 메모이제이션)
+# ==========================================
+# 같은 작업은 여러 크루 패키지에 반복 등장하므로 작업 섹션은 프로세스당 1번만 만든다.
+@functools.lru_cache(maxsize=None)
+def task_section_html(task):
+    jha = get_catalog().jha(task)
+    rows = "".join(f"<tr><td class='hz'>{html.escape(h)}</td></tr>" for h in jha["hazards"])
+    ctrl = "".join(f"<li>{html.escape(c)}</li>" for c in jha["controls"])
+    return (f"<h2>{html.escape(task)} <small>({html.escape(jha['category'])})</small></h2>"
+            f"<table><tr><th>⚠️ 위험 요인</th><th>✅ 안전 대책</th></tr>"
+            f"<tr><td style='width:35%'><table>{rows}</table></td><td><ol>{ctrl}</ol></td></tr></table>")
+
+
+@functools.lru_cache(maxsize=None)
+def task_rows(task):
+    jha = get_catalog().jha(task)
+    return tuple([(jha["category"], task, "hazard", i, h) for i, h in enumerate(jha["hazards"], 1)] +
+                 [(jha["category"], task, "control", i, c) for i, c in enumerate(jha["controls"], 1)])
+
+
+@functools.lru_cache(maxsize=1)
+def _baseline_html():
+    base = get_catalog().jha_baseline
+    items = "".join(f"<li>{html.escape(c)}</li>" for c in base["controls"])
+    return f"<h2>공통 안전 수칙</h2><p class='hz'>공통 위험: {html.escape(', '.join(base['hazards']))}</p><ul>{items}</ul>"
+
+
+def _meta_html(pkg):
+    fields = [("일자", pkg.get("date")), ("크루", pkg.get("crew")), ("위치", pkg.get("location")),
+              ("작업반장", pkg.get("foreman"))]
+    cells = "".join(f"<tr><td><b>{k}</b></td><td>{html.escape(str(v or '-'))}</td></tr>" for k, v in fields)
+    return f"<table class='meta'>{cells}</table>"
+
+
+def package_html(pkg):
+    """패키지 1건의 JHA 본문 (<div class='jha'>) — 작업 섹션은 캐시 재사용."""
+    merged = compose(pkg["tasks"])
+    summary = "".join(f"<li>{html.escape(h)} <small>← {html.escape(', '.join(src))}</small></li>"
+                      for h, src in merged["hazards"])
+    sign = "".join("<tr><td style='width:40%'></td><td></td><td style='width:20%'></td></tr>" for _ in range(6))
+    return (f"<div class='jha'><h1>작업 위험성 평가 (JHA) — {html.escape(pkg.get('crew') or '')}</h1>"
+            f"{_meta_html(pkg)}<h2>종합 위험 요인 ({len(merged['hazards'])})</h2><ul>{summary}</ul>"
+            + "".join(task_section_html(t) for t in pkg["tasks"]) + _baseline_html() +
+            f"<h2>참석자 확인</h2><table class='sign'><tr><th>성명</th><th>서명</th><th>시각</th></tr>{sign}</table></div>")
+
+
+def html_document(bodies, title="JHA"):
+    return (f"<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+            f"<style>{CSS}</style></head><body>{''.join(bodies)}</body></html>")
+
+
+def package_rows(pkg):
+    head = tuple(pkg.get(k, "") for k in ("date", "crew", "location", "foreman"))
+    return [head + r for t in pkg["tasks"] for r in task_rows(t)]
+
+
+def packet_pdf(packages):
+    """패키지 여러 건을 한 PDF 로 (패키지마다 새 쪽). fpdf2 + 한글 폰트 필요.
+
+    한글 폰트 로딩/서브셋이 문서당 비용의 대부분이므로 패키지별 파일 대신 묶음 단위로 만든다.
+    """
+    if not pdf_available():
+        raise RuntimeError("PDF 출력에는 fpdf2 와 한글 TTF 폰트 (TOOLBOX_PDF_FONT) 가 필요합니다.")
+    catalog = get_catalog()
+    pdf = FPDF(format="Letter")
+    pdf.add_font("kr", "", pdf_font())
+    pdf.set_auto_page_break(True, margin=15)
+    line = lambda text, size=10, h=6: (pdf.set_font("kr", size=size),
+                                       pdf.multi_cell(0, h, text, new_x="LMARGIN", new_y="NEXT"))
+    for pkg in packages:
+        merged = compose(pkg["tasks"])
+        pdf.add_page()
+        line(f"작업 위험성 평가 (JHA) — {pkg.get('crew') or ''}", 15, 9)
+        line(f"일자: {pkg.get('date') or '-'}   위치: {pkg.get('location') or '-'}   작업반장: {pkg.get('foreman') or '-'}")
+        line(f"종합 위험 요인: {', '.join(h for h, _ in merged['hazards'])}")
+        for task in pkg["tasks"]:
+            jha = catalog.jha(task)
+            pdf.ln(2)
+            line(f"■ {task} ({jha['category']})", 12, 7)
+            line("위험 요인: " + ", ".join(jha["hazards"]))
+            for i, c in enumerate(jha["controls"], 1):
+                line(f"   {i}. {c}")
+        pdf.ln(2)
+        line("공통 안전 수칙", 12, 7)
+        line("공통 위험: " + ", ".join(catalog.jha_baseline["hazards"]))
+        for c in catalog.jha_baseline["controls"]:
+            line(f"   • {c}")
+        pdf.ln(4)
+        line("참석자 확인 (성명 / 서명 / 시각)", 12, 7)
+        for _ in range(6):
+            line("_" * 80, 10, 8)
+    return bytes(pdf.output())
+
+
+# ==========================================
+# 📦 일괄 내보내기
+# ==========================================
+def _slug(text):
+    return re.sub(r"[^\w\-]+", "_", str(text or "").strip()).strip("_") or "crew"
+
+
+def _render_chunk(args):
+    # 패키지 묶음 → [(파일명, html 본문, csv 행)], 묶음 PDF — 프로세스 풀에서도 호출되므로 모듈 최상위 함수
+    packages, formats = args
+    results = []
+    for pkg in packages:
+        name = f"{_slug(pkg.get('date'))}_{_slug(pkg.get('crew'))}_{_slug(pkg.get('location'))}"
+        results.append((name, package_html(pkg), package_rows(pkg) if "csv" in formats else []))
+    return results, packet_pdf(packages) if "pdf" in formats and packages else None
+
+
+def export_packet(packages, formats=("html", "csv"), workers=None):
+    """하루치 JHA 패킷을 zip (bytes) 으로.
+
+    - html/ : 패키지별 문서, packet.html : 전체를 한 파일로 (인쇄 시 패키지마다 쪽 나눔)
+    - pdf/  : 묶음별 PDF (pdf_available() 일 때, 워커 1개 = 묶음 1개)
+    - jha.csv : 전체 위험요인/대책 행
+    PDF 를 포함하고 패키지가 POOL_MIN 개 이상이면 묶음으로 나눠 프로세스 풀에서 렌더링한다
+    (HTML/CSV 만이면 캐시된 섹션 이어붙이기라 풀 기동 비용이 더 큼).
+    """
+    formats = tuple(f for f in formats if f in FORMATS and (f != "pdf" or pdf_available()))
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 8) if "pdf" in formats and len(packages) >= POOL_MIN else 1
+    size = max(1, -(-len(packages) // workers))
+    chunks = [(packages[i:i + size], formats) for i in range(0, len(packages), size)] or [([], formats)]
+    if len(chunks) > 1:
+        # Streamlit 서버 스레드의 락이 복제되지 않도록 fork 대신 spawn
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_render_chunk, chunks))
+    else:
+        parts = [_render_chunk(chunks[0])]
+    results = [r for part, _ in parts for r in part]
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        if "html" in formats:
+            seen = {}
+            for name, body, _ in results:
+                seen[name] = seen.get(name, 0) + 1
+                suffix = f"_{seen[name]}" if seen[name] > 1 else ""
+                zf.writestr(f"html/{name}{suffix}.html", html_document([body], f"JHA {name}"))
+            zf.writestr("packet.html", html_document([body for _, body, _ in results], "JHA Packet"))
+        pdfs = [pdf for _, pdf in parts if pdf]
+        for i, pdf in enumerate(pdfs, 1):
+            zf.writestr("packet.pdf" if len(pdfs) == 1 else f"pdf/packet_{i:02d}.pdf", pdf)
+        if "csv" in formats:
+            out = io.StringIO()
+            writer = csv.writer(out)
+            writer.writerow(CSV_COLUMNS)
+            for _, _, rows in results:
+                writer.writerows(rows)
+            zf.writestr("jha.csv", "\ufeff" + out.getvalue())  # 엑셀 한글 깨짐 방지 BOM
+    return buf.getvalue()
+
+
+def cache_stats():
+    # 메모이제이션 적중 현황 (현재 프로세스)
+    return {f.__name__: f.cache_info()._asdict() for f in (compose, task_section_html, task_rows)}
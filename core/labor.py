@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# 일일 시간외 기준 (1인 1일)
+ST_HOURS = 8.0  # 이하 정상 근무
+DT_AFTER = 12.0  # 초과분 2.0배, 그 사이 1.5배
+OT_MULT, DT_MULT = 1.5, 2.0
+
+PERCENTILES = (50, 80, 95)
+CELLS_PER_BLOCK = 4_000_000  # 시행 x 행 블록 크기 (float64 약 32MB)
+POOL_CELLS = 500_000_000  # 시행 x 행이 이 이상이면 프로세스 풀 사용
+
+
+def split_hours(hours):
+    # 1인 1일 근무시간 → (정상, 1.5배, 2.0배) 시간
+    hours = np.asarray(hours, dtype=float)
+    st = np.minimum(hours, ST_HOURS)
+    ot = np.clip(hours - ST_HOURS, 0, DT_AFTER - ST_HOURS)
+    dt = np.maximum(hours - DT_AFTER, 0)
+    return st, ot, dt
+
+
+def labor_costs(schedule):
+    """크루 일정표 (people, rate_hr, hours[, crew, date ...]) 행마다 정상/할증 비용 계산."""
+    people = schedule["people"].to_numpy(dtype=float)
+    rate = schedule["rate_hr"].to_numpy(dtype=float)
+    st, ot, dt = split_hours(schedule["hours"].to_numpy(dtype=float))
+    pay = people * rate
+    return schedule.assign(st_hours=st, ot15_hours=ot, ot20_hours=dt,
+                           st_cost=pay * st, ot15_cost=pay * ot * OT_MULT, ot20_cost=pay * dt * DT_MULT,
+                           total_cost=pay * (st + ot * OT_MULT + dt * DT_MULT))
+
+
+def _simulate_block(args):
+    # 시행 n 개에 대한 (야근 비용, 총 비용) — 프로세스 풀에서도 호출되므로 모듈 최상위 함수
+    pay, hours, n, slip, noise, seed = args
+    rng = np.random.default_rng(seed)
+    pay, hours = pay.astype(np.float32), hours.astype(np.float32)
+    per_block = max(1, CELLS_PER_BLOCK // max(len(hours), 1))
+    ot_cost, total = np.empty(n), np.empty(n)
+    for start in range(0, n, per_block):
+        k = min(per_block, n - start)
+        # 공정 전체 지연 (삼각분포, 시행 단위) + 크루-일 단위 변동 (정규분포)
+        if slip[0] < slip[2]:
+            project = rng.triangular(*slip, size=(k, 1)).astype(np.float32)
+        else:
+            project = np.full((k, 1), slip[0], dtype=np.float32)
+        if noise:
+            h = rng.standard_normal((k, len(hours)), dtype=np.float32)
+            h *= noise
+            h += project
+        else:
+            h = np.repeat(project, len(hours), axis=1)
+        h += 1
+        np.maximum(h, 0, out=h)
+        h *= hours
+        # 가중 시간 = h + 0.5*(h-8)+ + 0.5*(h-12)+  (= 정상 + 1.5배 + 2.0배 환산)
+        straight = np.minimum(h, ST_HOURS) @ pay
+        w = np.maximum(h - ST_HOURS, 0) * (OT_MULT - 1) + np.maximum(h - DT_AFTER, 0) * (DT_MULT - OT_MULT)
+        w += h
+        total[start:start + k] = w @ pay
+        ot_cost[start:start + k] = total[start:start + k] - straight
+    return ot_cost, total
+
+
+# ==========================================
+# 🎲 공정 지연 몬테카를로
+# ==========================================
+def simulate_overtime(schedule, trials=100_000, slip=(0.0, 0.1, 0.3), noise=0.1, seed=0, workers=None):
+    """공정 지연을 반영한 야근 비용 분포.
+
+    slip: 공정 전체 지연률 삼각분포 (최소, 최빈, 최대) — 0.1 = 근무시간 10% 증가
+    noise: 크루-일 단위 추가 변동 (표준편차, 비율)
+    시행 x 행 을 블록 단위 행렬 연산으로 처리하고, 규모가 POOL_CELLS 를 넘으면
+    독립 시드로 나눠 프로세스 풀에서 병렬 실행한다.
+    반환: {"ot": {P50, P80, P95, mean}, "total": {...}, "samples": 야근 비용 배열}
+    """
+    pay = schedule["people"].to_numpy(dtype=float) * schedule["rate_hr"].to_numpy(dtype=float)
+    hours = schedule["hours"].to_numpy(dtype=float)
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 8) if trials * len(hours) >= POOL_CELLS else 1
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    sizes = [trials // workers + (i < trials % workers) for i in range(workers)]
+    jobs = [(pay, hours, n, slip, noise, s) for n, s in zip(sizes, seeds) if n]
+    if len(jobs) > 1:
+        # Streamlit 서버는 멀티스레드이므로 fork 대신 spawn (다른 스레드가 잡은 락 복제로 인한 교착 방지)
+        with ProcessPoolExecutor(max_workers=len(jobs), mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_simulate_block, jobs))
+    else:
+        parts = [_simulate_block(j) for j in jobs]
+    ot_cost = np.concatenate([p[0] for p in parts])
+    total = np.concatenate([p[1] for p in parts])
+
+    def stats(x):
+        q = np.percentile(x, PERCENTILES)
+        return {**{f"P{p}": float(v) for p, v in zip(PERCENTILES, q)}, "mean": float(x.mean())}
+
+    return {"ot": stats(ot_cost), "total": stats(total), "samples": ot_cost}
+
+
+def summarize(schedule, by="crew"):
+    # 크루별 (또는 by 컬럼별) 정상/할증 비용 합계
+    costs = labor_costs(schedule)
+    cols = ["st_hours", "ot15_hours", "ot20_hours", "st_cost", "ot15_cost", "ot20_cost", "total_cost"]
+    if by not in costs:
+        return costs[cols].sum().to_frame().T
+    return costs.groupby(by)[cols].sum().reset_index()
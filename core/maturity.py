@@ -0,0 +1,156 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+# ASTM C1074 기본값
+DATUM_C = -10.0  # Nurse-Saul 기준 온도 T0 (°C)
+Q_R = 5000.0  # 활성화 에너지 / 기체상수 (K)
+REF_C = 20.0  # 등가재령 기준 온도 (°C)
+
+# 강도-적산온도 관계 S = a + b·log10(M) 예시 계수 (psi, °C·hr)
+# 실제 사용 시 배합별 검량(calibration) 값으로 교체
+STRENGTH_A, STRENGTH_B = -5000.0, 2500.0
+
+BLOCK_BYTES = 8 * 1024 * 1024
+# 로거 파일 경로 입력을 허용할 서버 디렉터리 (없으면 업로드만 사용)
+LOGGER_DIR = os.environ.get("TOOLBOX_LOGGER_DIR", "")
+
+
+def maturity_increments(hours, temp_c, datum_c=DATUM_C, q_r=Q_R, ref_c=REF_C):
+    # 연속 측정점 사이 구간별 (온도시간 인자 °C·hr, 등가재령 hr) — 구간 평균온도 사용
+    dt = np.maximum(np.diff(hours), 0)
+    ta = (temp_c[1:] + temp_c[:-1]) / 2
+    ttf = np.maximum(ta - datum_c, 0) * dt
+    eq = np.exp(-q_r * (1 / (ta + 273.15) - 1 / (ref_c + 273.15))) * dt
+    return ttf, eq
+
+
+def logger_path(name, root=None):
+    """LOGGER_DIR 기준 상대 경로 → 실제 경로. 디렉터리 밖 (.., 절대 경로, 심볼릭 링크) 은 ValueError."""
+    root = root or LOGGER_DIR
+    if not root:
+        raise ValueError("로거 디렉터리 (TOOLBOX_LOGGER_DIR) 가 설정되지 않았습니다.")
+    base = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(base, name))
+    if os.path.commonpath([base, path]) != base or not os.path.isfile(path):
+        raise ValueError(f"로거 디렉터리 안의 파일이 아닙니다: {name!r}")
+    return path
+
+
+def strength_from_maturity(m, a=STRENGTH_A, b=STRENGTH_B):
+    m = np.asarray(m, dtype=float)
+    with np.errstate(divide="ignore"):
+        return np.maximum(a + b * np.log10(m), 0)
+
+
+# ==========================================
+# 🌡️ 적산온도 누적기 (스트리밍)
+# ==========================================
+class MaturityTracker:
+    """온도 로거 CSV 를 청크 단위로 읽어 적산온도/등가재령을 누적.
+
+    누적값과 마지막 측정점만 들고 있으므로 파일 크기와 무관하게 메모리가 일정하다.
+    update_file() 은 지난번에 읽은 바이트 위치부터 새로 추가된 행만 읽는다 (append 모드).
+    """
+
+    def __init__(self, time_col="timestamp", temp_col="temp_c", unit="C",
+                 datum_c=DATUM_C, q_r=Q_R, ref_c=REF_C, a=STRENGTH_A, b=STRENGTH_B):
+        self.time_col, self.temp_col, self.unit = time_col, temp_col, unit
+        self.datum_c, self.q_r, self.ref_c = datum_c, q_r, ref_c
+        self.a, self.b = a, b
+        self.reset()
+
+    def reset(self):
+        self.ttf = 0.0  # °C·hr
+        self.eq_age = 0.0  # hr @ ref_c
+        self.rows = 0
+        self.skipped = 0  # 건너뛴 결측 / 비정상 행
+        self.first_time = None
+        self._last = None  # (hours, temp_c)
+        self._offset = 0
+        self._columns = None
+
+    @property
+    def strength(self):
+        return float(strength_from_maturity(self.ttf, self.a, self.b)) if self.ttf > 0 else 0.0
+
+    @property
+    def last_time(self):
+        return None if self._last is None else pd.Timestamp(int(self._last[0] * 3.6e12))
+
+    def summary(self):
+        return {"rows": self.rows, "skipped": self.skipped, "ttf_c_hr": self.ttf, "eq_age_hr": self.eq_age,
+                "strength": self.strength, "first_time": self.first_time, "last_time": self.last_time}
+
+    def update_frame(self, df):
+        if df.empty:
+            return
+        # 빈 칸 / 숫자가 아닌 값 / 잘못된 시각은 건너뜀 (NaN 하나가 누적값 전체를 오염시키지 않도록)
+        stamp = pd.to_datetime(df[self.time_col], errors="coerce")
+        temp = pd.to_numeric(df[self.temp_col], errors="coerce").to_numpy(dtype=float)
+        valid = stamp.notna().to_numpy() & np.isfinite(temp)
+        self.skipped += int((~valid).sum())
+        if not valid.any():
+            return
+        hours = stamp[valid].to_numpy("datetime64[ns]").astype("int64") / 3.6e12
+        temp = temp[valid]
+        if self.unit.upper() == "F":
+            temp = (temp - 32) * 5 / 9
+        if self._last is None:
+            self.first_time = pd.Timestamp(int(hours[0] * 3.6e12))
+        else:
+            hours = np.concatenate(([self._last[0]], hours))
+            temp = np.concatenate(([self._last[1]], temp))
+        ttf, eq = maturity_increments(hours, temp, self.datum_c, self.q_r, self.ref_c)
+        self.ttf += float(ttf.sum())
+        self.eq_age += float(eq.sum())
+        self.rows += int(valid.sum())
+        self._last = (float(hours[-1]), float(temp[-1]))
+
+    def update_buffer(self, f, block_bytes=BLOCK_BYTES, final=False):
+        # 바이너리 파일 객체를 self._offset 부터 끝까지, 완결된 줄 단위로 읽음
+        # final=True (업로드처럼 완성된 파일) 이면 줄바꿈 없는 마지막 줄도 반영
+        if self._offset == 0:
+            f.seek(0)
+            header = f.readline()
+            self._columns = pd.read_csv(io.BytesIO(header)).columns.tolist()
+            self._offset = f.tell()
+        f.seek(self._offset)
+        carry = b""
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            block = carry + block
+            cut = block.rfind(b"\n") + 1
+            carry = block[cut:]
+            if cut:
+                self.update_frame(pd.read_csv(io.BytesIO(block[:cut]), header=None, names=self._columns))
+                self._offset += cut
+        if final and carry.strip():
+            self.update_frame(pd.read_csv(io.BytesIO(carry), header=None, names=self._columns))
+            self._offset += len(carry)
+        # 그 외 carry: 로거가 아직 쓰는 중인 마지막 줄 → 다음 update 때 다시 읽음
+
+    def update_file(self, path, block_bytes=BLOCK_BYTES):
+        if os.path.getsize(path) < self._offset:
+            self.reset()  # 파일이 교체/초기화됨
+        with open(path, "rb") as f:
+            self.update_buffer(f, block_bytes)
+        return self.summary()
+
+    def to_dict(self):
+        return {"ttf": self.ttf, "eq_age": self.eq_age, "rows": self.rows, "skipped": self.skipped,
+                "last": self._last,
+                "first_time": None if self.first_time is None else self.first_time.isoformat(),
+                "offset": self._offset, "columns": self._columns}
+
+    def load_dict(self, d):
+        self.ttf, self.eq_age, self.rows = d["ttf"], d["eq_age"], d["rows"]
+        self.skipped = d.get("skipped", 0)
+        self._last = None if d["last"] is None else tuple(d["last"])
+        self.first_time = None if d["first_time"] is None else pd.Timestamp(d["first_time"])
+        self._offset, self._columns = d["offset"], d["columns"]
+        return self
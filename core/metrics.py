@@ -0,0 +1,215 @@
+import bisect
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 지연시간 히스토그램 버킷 (초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RECENT = 512  # 디버그 패널 백분위용 최근 샘플 수
+
+METRICS_FILE = os.environ.get("TOOLBOX_METRICS_FILE") or os.path.join(
+    os.environ.get("TOOLBOX_CACHE_DIR",
+                   os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")),
+    "metrics.prom")
+
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    body = ",".join(f'{k}="{esc(v)}"' for k, v in labels)
+    return "{" + body + "}"
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.recent = deque(maxlen=RECENT)
+
+    def observe(self, v):
+        self.counts[bisect.bisect_left(self.buckets, v)] += 1
+        self.sum += v
+        self.count += 1
+        self.recent.append(v)
+
+
+# ==========================================
+# 📊 프로세스 단위 메트릭 레지스트리
+# ==========================================
+class Registry:
+    """카운터 / 게이지 / 히스토그램을 모아 Prometheus 텍스트 형식으로 내보낸다.
+
+    모든 세션(스크립트 스레드)과 내보내기 스레드가 공유하므로 잠금으로 보호한다.
+    이름에는 prefix 가 붙고, 카운터는 _total, 히스토그램은 _seconds 단위로 쓴다.
+    """
+
+    def __init__(self, prefix="toolbox", buckets=BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._gauges = {}
+        self._hists = {}
+        self._collectors = {}
+        self._written = 0.0
+        self._server = None
+        self.started = time.time()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    # --- 기록 ---
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            self._counters[self._key(name, labels)] += value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._gauges[self._key(name, labels)] = value
+
+    def observe(self, name, seconds, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            h = self._hists.get(key)
+            if h is None:
+                h = self._hists[key] = _Histogram(self.buckets)
+            h.observe(seconds)
+
+    @contextmanager
+    def track(self, name, **labels):
+        # 블록 실행 시간을 name 히스토그램에, 예외 발생 시 name 에서 _seconds 를 뗀 _errors 카운터에 기록
+        t0 = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc(name.removesuffix("_seconds") + "_errors", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - t0, **labels)
+
+    def collector(self, name, fn, label="key", kind="gauge"):
+        # 내보낼 때마다 fn() → {라벨값: 숫자} (또는 숫자 하나) 를 수집 (같은 이름이면 교체)
+        # kind="counter" 는 누적값 (단조 증가) — _total 카운터로 내보내 rate() 에 쓸 수 있게 함
+        with self._lock:
+            self._collectors[name] = (fn, label, kind)
+
+    # --- 조회 ---
+    def counter(self, name, **labels):
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def _collect(self):
+        # → (게이지, 카운터) {(이름, 라벨): 값}
+        with self._lock:
+            collectors = list(self._collectors.items())
+        out = {"gauge": {}, "counter": {}}
+        for name, (fn, label, kind) in collectors:
+            try:
+                values = fn()
+            except Exception:
+                continue
+            if not isinstance(values, dict):
+                out[kind][(name, ())] = values
+                continue
+            for k, v in values.items():
+                out[kind][(name, ((label, k),))] = v
+        return out["gauge"], out["counter"]
+
+    def snapshot(self):
+        """디버그 패널용 요약: (counters, gauges, histograms) 행 목록."""
+        gauges, counters = self._collect()
+        with self._lock:
+            counters.update(self._counters)
+            counters = [{"name": n, **dict(l), "value": v} for (n, l), v in sorted(counters.items())]
+            gauges.update(self._gauges)
+            hists = []
+            for (n, l), h in sorted(self._hists.items()):
+                recent = sorted(h.recent)
+                pick = lambda q: recent[min(len(recent) - 1, int(q * len(recent)))] * 1000 if recent else None
+                hists.append({"name": n, **dict(l), "count": h.count, "mean_ms": h.sum / h.count * 1000,
+                              "p50_ms": pick(0.50), "p95_ms": pick(0.95), "max_ms": recent[-1] * 1000 if recent else None})
+        gauges = [{"name": n, **dict(l), "value": v} for (n, l), v in sorted(gauges.items(), key=lambda kv: kv[0])]
+        return counters, gauges, hists
+
+    # --- 내보내기 ---
+    def render(self):
+        """Prometheus text exposition format (0.0.4)."""
+        p = self.prefix
+        gauges, counters = self._collect()
+        lines = []
+        with self._lock:
+            counters.update(self._counters)
+            gauges.update(self._gauges)
+            gauges[("uptime_seconds", ())] = time.time() - self.started
+            seen = set()
+            for (n, l), v in sorted(counters.items()):
+                if n not in seen:
+                    lines.append(f"# TYPE {p}_{n}_total counter")
+                    seen.add(n)
+                lines.append(f"{p}_{n}_total{_label_str(l)} {v:g}")
+            for (n, l), v in sorted(gauges.items()):
+                if n not in seen:
+                    lines.append(f"# TYPE {p}_{n} gauge")
+                    seen.add(n)
+                lines.append(f"{p}_{n}{_label_str(l)} {v:g}")
+            for (n, l), h in sorted(self._hists.items()):
+                if n not in seen:
+                    lines.append(f"# TYPE {p}_{n} histogram")
+                    seen.add(n)
+                cum = 0
+                for le, c in zip(self.buckets + (float("inf"),), h.counts):
+                    cum += c
+                    le_s = "+Inf" if le == float("inf") else f"{le:g}"
+                    lines.append(f"{p}_{n}_bucket{_label_str(l + (('le', le_s),))} {cum}")
+                lines.append(f"{p}_{n}_sum{_label_str(l)} {h.sum:.6f}")
+                lines.append(f"{p}_{n}_count{_label_str(l)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path=METRICS_FILE, min_interval=10):
+        # node_exporter textfile collector 용 파일 (원자적 교체, min_interval 초에 1번)
+        now = time.monotonic()
+        if now - self._written < min_interval:
+            return False
+        self._written = now
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+        return True
+
+    def serve(self, port, host="0.0.0.0"):
+        """/metrics HTTP 엔드포인트를 데몬 스레드로 시작 (프로세스당 1번)."""
+        with self._lock:
+            if self._server is not None:
+                return self._server
+            registry = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = registry.render().encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((host, port), Handler)
+            threading.Thread(target=self._server.serve_forever, daemon=True, name="metrics-http").start()
+            return self._server
+
+
+METRICS = Registry()
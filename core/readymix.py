@@ -0,0 +1,160 @@
+"""레미콘 물량 산출 파이프라인 (BIM 부재 물량표 → 타설별 물량/차량 대수).
+
+    python -m core.readymix takeoff.csv [--state takeoff.pkl] [--unit ft] [--truck 10] [--out pours.csv]
+
+입력 CSV: element_id, element_type, pour, level, pour_date, length, width, depth
+          [, diameter (원형 기둥), count]
+--state 를 주면 지난 실행 결과를 불러와 바뀐 부재만 다시 계산하고 저장한다.
+"""
+import argparse
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from core.units import FACTORS
+
+# 부재 종류별 할증률 (loss/waste)
+WASTE = {"slab": 0.05, "footing": 0.10, "wall": 0.05, "column": 0.03, "beam": 0.05}
+DEFAULT_WASTE = 0.05
+TRUCK_YD3 = 10.0  # 믹서트럭 1대 적재량
+ORDER_STEP_YD3 = 0.5  # 주문 단위
+
+GROUP_COLS = ["pour", "level", "pour_date"]
+INPUT_COLS = ["element_type", "pour", "level", "pour_date", "length", "width", "depth", "diameter", "count"]
+YD3 = FACTORS["yd3"][1]
+
+
+def element_volumes(df, unit="ft", waste=None):
+    # 부재별 할증 포함 물량 (m³)
+    waste = WASTE if waste is None else waste
+    k = FACTORS[unit][1] ** 3
+    depth = df["depth"].to_numpy(dtype=float)
+    vol = df["length"].to_numpy(dtype=float) * df["width"].to_numpy(dtype=float) * depth
+    if "diameter" in df:
+        dia = df["diameter"].to_numpy(dtype=float)
+        vol = np.where(np.isnan(dia), vol, np.pi * (dia / 2) ** 2 * depth)
+    if "count" in df:
+        vol = vol * df["count"].fillna(1).to_numpy(dtype=float)
+    factor = df["element_type"].astype(str).str.lower().map(waste).fillna(DEFAULT_WASTE).to_numpy()
+    return np.nan_to_num(vol) * k * (1 + factor)
+
+
+def truck_summary(totals_m3, truck_yd3=TRUCK_YD3):
+    # 타설 그룹별 m³ → 주문 yd³ (0.5 단위 올림) / 차량 대수 (올림)
+    out = totals_m3.rename("m3").reset_index()
+    out["yd3"] = out["m3"] / YD3
+    out["order_yd3"] = np.ceil(out["yd3"].round(6) / ORDER_STEP_YD3) * ORDER_STEP_YD3
+    out["trucks"] = np.ceil(out["order_yd3"] / truck_yd3).astype(int)
+    return out
+
+
+# ==========================================
+# 🚛 증분 물량 산출
+# ==========================================
+class TakeoffPipeline:
+    """물량표를 청크 단위로 읽어 타설 그룹별 물량을 누적.
+
+    부재마다 (행 해시, 그룹, 물량) 만 기억해 두고, 다음 실행에서는 해시가 바뀐
+    부재만 물량을 다시 계산해 이전 값과의 차이만 그룹 합계에 반영한다.
+    파일에서 사라진 부재는 합계에서 빠진다.
+    """
+
+    def __init__(self, unit="ft", waste=None, truck_yd3=TRUCK_YD3):
+        self.unit, self.waste, self.truck_yd3 = unit, waste, truck_yd3
+        self.elements = pd.DataFrame({"hash": pd.Series(dtype="uint64"), "m3": pd.Series(dtype=float)},
+                                     index=pd.Index([], name="element_id"))
+        for c in GROUP_COLS:
+            self.elements[c] = pd.Series(dtype=object)
+        self.totals = pd.Series(dtype=float, index=pd.MultiIndex.from_tuples([], names=GROUP_COLS))
+        self.last_run = {}
+
+    @staticmethod
+    def _add(totals, frame, sign):
+        if not len(frame):
+            return totals
+        delta = frame.groupby(GROUP_COLS, dropna=False)["m3"].sum() * sign
+        return totals.add(delta, fill_value=0)
+
+    def run(self, src, chunksize=100_000):
+        # 중간에 실패해도 기존 상태가 깨지지 않도록 끝에서 한 번에 반영
+        totals, seen, updates, rows, changed = self.totals, [], [], 0, 0
+        for chunk in pd.read_csv(src, chunksize=chunksize, dtype={"pour": str, "level": str, "pour_date": str}):
+            chunk = chunk.set_index("element_id")
+            cols = [c for c in INPUT_COLS if c in chunk]
+            h = pd.util.hash_pandas_object(chunk[cols], index=True).to_numpy()
+            pos = self.elements.index.get_indexer(chunk.index)
+            known = pos >= 0
+            mask = ~known
+            mask[known] = self.elements["hash"].to_numpy()[pos[known]] != h[known]
+
+            seen.append(chunk.index.to_numpy())
+            rows += len(chunk)
+            if mask.any():
+                new = chunk.loc[mask, GROUP_COLS].copy()
+                new["m3"] = element_volumes(chunk.loc[mask], self.unit, self.waste)
+                new["hash"] = h[mask]
+                totals = self._add(totals, self.elements.iloc[pos[mask & known]], -1)
+                totals = self._add(totals, new, 1)
+                updates.append(new)
+                changed += int(mask.sum())
+
+        ids = pd.Index(np.concatenate(seen) if seen else [])
+        if not ids.is_unique:
+            # 같은 부재가 두 번 나오면 상태 인덱스가 깨지므로 반영 전에 거부 (청크 안 / 청크 사이 모두)
+            dups = ids[ids.duplicated()].unique()
+            more = f" 외 {len(dups) - 10}건" if len(dups) > 10 else ""
+            raise ValueError(f"중복 element_id: {', '.join(map(str, dups[:10]))}{more}")
+        removed = self.elements.index.difference(ids)
+        totals = self._add(totals, self.elements.loc[removed], -1)
+        touched = removed.union(pd.Index(np.concatenate([u.index.to_numpy() for u in updates]))
+                                if updates else pd.Index([]))
+        self.elements = pd.concat([self.elements.drop(touched, errors="ignore")] + updates)
+        self.totals = totals[totals.round(9) != 0].sort_index()
+        self.last_run = {"rows": rows, "changed": changed, "removed": len(removed)}
+        return self.summary()
+
+    def summary(self):
+        return truck_summary(self.totals, self.truck_yd3)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m core.readymix", description="레미콘 물량 산출")
+    ap.add_argument("takeoff")
+    ap.add_argument("--state", help="증분 계산 상태 파일 (pickle)")
+    ap.add_argument("--unit", default="ft", help="치수 단위 (ft, in, m, mm ...)")
+    ap.add_argument("--truck", type=float, default=TRUCK_YD3, help="트럭 1대 yd³")
+    ap.add_argument("--chunksize", type=int, default=100_000)
+    ap.add_argument("--out", help="타설별 결과 CSV")
+    args = ap.parse_args(argv)
+
+    try:
+        pipe = TakeoffPipeline.load(args.state) if args.state else None
+    except FileNotFoundError:
+        pipe = None
+    if pipe is None or pipe.unit != args.unit:
+        pipe = TakeoffPipeline(args.unit, truck_yd3=args.truck)
+    pipe.truck_yd3 = args.truck
+    summary = pipe.run(args.takeoff, args.chunksize)
+    if args.state:
+        pipe.save(args.state)
+    if args.out:
+        summary.to_csv(args.out, index=False)
+    else:
+        print(summary.to_string(index=False))
+    r = pipe.last_run
+    print(f"{r['rows']:,} rows · {r['changed']:,} changed · {r['removed']:,} removed · "
+          f"{summary['trucks'].sum():,} trucks", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import functools
+import math
+import re
+
+# pandas/numpy 는 벌크 변환에서만 import (단건 변환 화면 콜드 스타트 절약)
+
+# ==========================================
+# 📏 단위 표 (기준: m, m², m³, kg)
+# ==========================================
+_IN, _FT, _YD = 0.0254, 0.3048, 0.9144
+UNITS = {
+    "length": {"mm": 1e-3, "cm": 1e-2, "m": 1.0, "km": 1e3,
+               "in": _IN, "inch": _IN, "inches": _IN, '"': _IN, "″": _IN,
+               "ft": _FT, "feet": _FT, "foot": _FT, "'": _FT, "′": _FT, "yd": _YD, "mi": 1609.344},
+    "area": {"mm2": 1e-6, "cm2": 1e-4, "m2": 1.0, "ha": 1e4, "km2": 1e6, "평": 400 / 121,
+             "in2": _IN ** 2, "ft2": _FT ** 2, "sf": _FT ** 2, "sqft": _FT ** 2, "yd2": _YD ** 2,
+             "acre": 4046.8564224},
+    "volume": {"cm3": 1e-6, "cc": 1e-6, "l": 1e-3, "m3": 1.0, "루베": 1.0,
+               "in3": _IN ** 3, "ft3": _FT ** 3, "cf": _FT ** 3, "yd3": _YD ** 3, "cy": _YD ** 3,
+               "gal": 0.003785411784},
+    "weight": {"g": 1e-3, "kg": 1.0, "t": 1e3, "tonne": 1e3, "lb": 0.45359237, "lbs": 0.45359237,
+               "oz": 0.028349523125, "kip": 453.59237, "ton": 907.18474},
+}
+# 별칭 → (차원, 기준단위 환산계수) — 한 번만 만들어 두는 조회표
+FACTORS = {u: (dim, f) for dim, table in UNITS.items() for u, f in table.items()}
+DISPLAY_UNITS = {"length": ["mm", "m", "in", "ft"], "area": ["m2", "ft2", "평"],
+                 "volume": ["m3", "ft3", "yd3", "l"], "weight": ["kg", "t", "lb", "ton"]}
+
+_SUPERSCRIPT = str.maketrans({"²": "2", "³": "3"})
+
+# 항 하나: 숫자 [분수] [단위]  예) 10' / 6 1/2" / 3/8 / 2.5 m / 1,200mm
+TERM_RE = re.compile(r"""
+    \s*(?:
+        (?P<n>\d+)/(?P<d>\d+)
+      | (?P<whole>\d[\d,]*(?:\.\d+)?|\.\d+)(?:[\s-]+(?P<fn>\d+)/(?P<fd>\d+))?
+    )
+    \s*(?P<unit>[a-zA-Z가-힣'"′″]+\^?[23²³]?)?
+    \s*-?""", re.X)
+# 벌크 변환 빠른 경로: "숫자 [단위]" 단일 항
+SIMPLE_RE = r"^\s*(\d[\d,]*(?:\.\d+)?|\.\d+)\s*([a-zA-Z가-힣'\"′″]+\^?[23²³]?)?\s*$"
+
+
+def _unit_key(unit):
+    u = unit.translate(_SUPERSCRIPT).replace("^", "")
+    return u if u in FACTORS else u.lower()
+
+
+@functools.lru_cache(maxsize=65536)
+def parse(expr, default_unit="in"):
+    """현장 표기 → (기준단위 값, 차원). 예) 10'-6 1/2" → (3.213 m, "length")
+
+    단위 없는 항은 default_unit 으로 본다 (분수 3/8 은 보통 인치).
+    한 식 안의 항들은 같은 차원이어야 하며 합산된다.
+    """
+    text = expr.strip()
+    pos, total, dim = 0, 0.0, None
+    while pos < len(text):
+        m = TERM_RE.match(text, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"해석할 수 없는 표기: {expr!r}")
+        if int(m["d"] or m["fd"] or 1) == 0:
+            raise ValueError(f"분모가 0 인 분수: {expr!r}")
+        if m["n"]:
+            value = int(m["n"]) / int(m["d"])
+        else:
+            value = float(m["whole"].replace(",", ""))
+            if m["fn"]:
+                value += int(m["fn"]) / int(m["fd"])
+        key = _unit_key(m["unit"] or default_unit)
+        if key not in FACTORS:
+            raise ValueError(f"알 수 없는 단위: {m['unit']!r}")
+        term_dim, factor = FACTORS[key]
+        if dim is not None and term_dim != dim:
+            raise ValueError(f"차원이 섞인 표기: {expr!r}")
+        dim = term_dim
+        total += value * factor
+        pos = m.end()
+    if dim is None:
+        raise ValueError(f"빈 표기: {expr!r}")
+    return total, dim
+
+
+def convert(expr, to_unit, default_unit="in"):
+    base, dim = parse(expr, default_unit)
+    to_dim, factor = FACTORS[_unit_key(to_unit)]
+    if to_dim != dim:
+        raise ValueError(f"{dim} 을(를) {to_unit} 로 변환할 수 없습니다.")
+    return base / factor
+
+
+def format_ft_in(meters, denom=16):
+    # 10'-6 1/2" 형식 (1/denom 인치 반올림)
+    ticks = int(round(meters / _IN * denom))
+    ft, rem = divmod(ticks, 12 * denom)
+    inch, frac = divmod(rem, denom)
+    if frac:
+        g = math.gcd(frac, denom)
+        return f"{ft}'-{inch} {frac // g}/{denom // g}\""
+    return f"{ft}'-{inch}\""
+
+
+# ==========================================
+# 📋 벌크 변환
+# ==========================================
+def convert_many(values, to_unit, default_unit="in"):
+    """표기 문자열 배열을 to_unit 값 배열로 (해석 불가 / 차원 불일치는 nan).
+
+    "숫자 [단위]" 단일 항은 str.extract + 조회표 매핑으로 한 번에 처리하고,
+    나머지 복합 표기만 고유값 단위로 parse() (LRU 캐시) 를 거친다.
+    """
+    import numpy as np
+    import pandas as pd
+
+    to_dim, to_factor = FACTORS[_unit_key(to_unit)]
+    s = pd.Series(values, dtype=object).astype(str)
+    simple = s.str.extract(SIMPLE_RE)
+    units = simple[1].fillna(default_unit).map(_unit_key)
+    factor = units.map({u: f for u, (d, f) in FACTORS.items() if d == to_dim})
+    number = pd.to_numeric(simple[0].str.replace(",", "", regex=False), errors="coerce")
+    out = np.array(number * factor / to_factor, dtype=float)
+
+    rest = simple[0].isna().to_numpy()
+    if rest.any():
+        codes, uniques = pd.factorize(s[rest])
+        parsed = np.full(len(uniques), np.nan)
+        for i, u in enumerate(uniques):
+            try:
+                base, dim = parse(u, default_unit)
+            except ValueError:
+                continue
+            if dim == to_dim:
+                parsed[i] = base / to_factor
+        out[rest] = parsed[codes]
+    return out
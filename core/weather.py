@@ -0,0 +1,203 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.metrics import METRICS
+
+# 벤치마크/오프라인 환경에서는 TOOLBOX_WTTR_URL 로 로컬 스텁 지정
+WTTR_URL = os.environ.get("TOOLBOX_WTTR_URL", "https://wttr.in/{}?format=j1")
+
+
+def normalize_location(location):
+    # "  Atlanta,GA " / "atlanta, ga" 를 같은 키로 취급
+    return " ".join(location.replace(",", ", ").split()).lower()
+
+
+def parse_current(data):
+    # (temp °F, humidity %, wind mph)
+    current = data['current_condition'][0]
+    return float(current['temp_F']), float(current['humidity']), float(current['windspeedMiles'])
+
+
+def parse_local_time(data):
+    # 현장 현지 관측 시각 (wttr.in localObsDateTime, 예: "2024-05-01 02:30 PM") — 없으면 None
+    try:
+        return pd.to_datetime(data['current_condition'][0]['localObsDateTime'], format="%Y-%m-%d %I:%M %p")
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def parse_hourly(data, upcoming=False):
+    """wttr.in 3일 x 3시간 간격 예보 → DataFrame(time, temp_F, humidity, wind_mph).
+
+    time 은 현장 현지 시각. upcoming=True 면 현지 관측 시각 이전 슬롯은 뺀다 (지난 시간 추천 방지).
+    """
+    rows = []
+    for day in data.get('weather', []):
+        base = pd.Timestamp(day['date'])
+        for hour in day.get('hourly', []):
+            rows.append((base + pd.Timedelta(hours=int(hour['time']) // 100),
+                         float(hour['tempF']), float(hour['humidity']), float(hour['windspeedMiles'])))
+    df = pd.DataFrame(rows, columns=["time", "temp_F", "humidity", "wind_mph"])
+    now = parse_local_time(data) if upcoming else None
+    if now is not None:
+        df = df[df["time"] >= now].reset_index(drop=True)
+    return df
+
+
+def forecast_arrays(payloads):
+    """여러 현장의 남은 예보를 (현장, 시간) 배열로 쌓기 — 가장 긴 예보 길이에 맞춤.
+
+    현장마다 시간대 / 날짜가 다르므로 times 도 (현장, 시간) 배열 (각 현장 현지 시각).
+    남은 예보가 짧은 현장의 뒷부분은 nan / NaT 로 채운다 (다른 현장의 탐색 범위를 줄이지 않도록).
+    """
+    frames = [parse_hourly(p, upcoming=True) for p in payloads]
+    n = max((len(f) for f in frames), default=0)
+    times = np.full((len(frames), n), np.datetime64("NaT"), dtype="datetime64[ns]")
+    values = np.full((3, len(frames), n), np.nan)
+    for i, f in enumerate(frames):
+        times[i, :len(f)] = f["time"].to_numpy()
+        values[:, i, :len(f)] = f[["temp_F", "humidity", "wind_mph"]].to_numpy(dtype=float).T
+    return times, values[0], values[1], values[2]
+
+
+class _Flight:
+    # 같은 위치에 대한 진행 중인 업스트림 호출 1건
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# ==========================================
+# 🌤️ 프로세스 공용 날씨 캐시
+# ==========================================
+class WeatherCache:
+    """wttr.in 응답(JSON)을 위치별로 캐싱.
+
+    - ttl 이내: 캐시 그대로 반환 (hit)
+    - ttl ~ ttl+stale_ttl: 옛 값을 즉시 반환하고 백그라운드에서 갱신 (stale)
+    - 같은 위치를 동시에 조회하면 업스트림 호출 1번을 공유 (coalesced)
+    - 항목은 최대 max_entries 개 (LRU), 저장할 때 ttl+stale_ttl 이 지난 항목은 삭제 (evicted)
+    """
+
+    def __init__(self, ttl=600, stale_ttl=3600, timeout=5, pool_size=32, max_entries=512):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (fetched_at, payload), 최근 사용 순
+        self._inflight = {}  # key -> _Flight
+        self._stats = {"hit": 0, "miss": 0, "stale": 0, "coalesced": 0, "error": 0, "evicted": 0}
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, location):
+        key = normalize_location(location)
+        now = time.monotonic()
+        leader = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry[0]
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                if age < self.ttl:
+                    self._stats["hit"] += 1
+                    return entry[1]
+                if age < self.ttl + self.stale_ttl:
+                    self._stats["stale"] += 1
+                    if key not in self._inflight:
+                        flight = self._inflight[key] = _Flight()
+                        threading.Thread(target=self._run, args=(key, flight), daemon=True).start()
+                    return entry[1]
+            flight = self._inflight.get(key)
+            if flight is not None:
+                self._stats["coalesced"] += 1
+            else:
+                flight = self._inflight[key] = _Flight()
+                self._stats["miss"] += 1
+                leader = True
+
+        if leader:
+            self._run(key, flight)
+        elif not flight.done.wait(self.timeout + 1):
+            raise TimeoutError(f"weather lookup timed out: {location}")
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def _store(self, key, payload):
+        # self._lock 안에서 호출 — 만료 항목 정리 후 개수 초과분은 가장 오래 안 쓴 것부터 삭제
+        now = time.monotonic()
+        self._entries[key] = (now, payload)
+        self._entries.move_to_end(key)
+        expired = [k for k, (t, _) in self._entries.items() if now - t >= self.ttl + self.stale_ttl]
+        for k in expired:
+            del self._entries[k]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evicted"] += 1
+        self._stats["evicted"] += len(expired)
+
+    def _run(self, key, flight):
+        try:
+            with METRICS.track("upstream_seconds", service="wttr.in"):
+                response = self._session.get(WTTR_URL.format(key), timeout=self.timeout)
+                response.raise_for_status()
+            flight.result = response.json()
+            with self._lock:
+                self._store(key, flight.result)
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                self._stats["error"] += 1
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+
+# --- 다중 현장 동시 조회 ---
+def fetch_many(cache, locations, max_workers=8, timeout=8):
+    """여러 위치를 스레드풀로 동시에 조회. {location: (payload, error)} 반환.
+
+    max_workers 로 동시 업스트림 호출 수를 제한하고, timeout 초 안에
+    끝나지 않은 현장은 "Timeout" 으로 표시한다 (전체 대기시간 ≒ 1회 조회).
+    """
+    locations = list(dict.fromkeys(loc.strip() for loc in locations if loc.strip()))
+    if not locations:
+        return {}
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(locations)))
+    try:
+        futures = {pool.submit(cache.get, loc): loc for loc in locations}
+        wait(futures, timeout=timeout)
+        results = {}
+        for fut, loc in futures.items():
+            if not fut.done():
+                results[loc] = (None, "Timeout")
+            elif fut.exception() is not None:
+                results[loc] = (None, "Error")
+            else:
+                results[loc] = (fut.result(), None)
+        return results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
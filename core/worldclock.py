@@ -0,0 +1,123 @@
+import functools
+from datetime import datetime, timezone
+
+import numpy as np
+import pytz
+
+DAY_MIN = 24 * 60
+
+# 기본 현장 (현장명, 시간대, 통화, 현지 근무 시작/종료)
+DEFAULT_SITES = [
+    {"site": "Seoul HQ", "tz": "Asia/Seoul", "ccy": "KRW", "start": "08:00", "end": "17:00"},
+    {"site": "Tokyo", "tz": "Asia/Tokyo", "ccy": "JPY", "start": "08:00", "end": "17:00"},
+    {"site": "Singapore", "tz": "Asia/Singapore", "ccy": "SGD", "start": "08:00", "end": "17:00"},
+    {"site": "Ho Chi Minh", "tz": "Asia/Ho_Chi_Minh", "ccy": "VND", "start": "07:00", "end": "16:00"},
+    {"site": "Dubai", "tz": "Asia/Dubai", "ccy": "AED", "start": "07:00", "end": "15:00"},
+    {"site": "Sydney", "tz": "Australia/Sydney", "ccy": "AUD", "start": "07:00", "end": "15:30"},
+    {"site": "London", "tz": "Europe/London", "ccy": "GBP", "start": "08:00", "end": "16:30"},
+    {"site": "Berlin", "tz": "Europe/Berlin", "ccy": "EUR", "start": "07:00", "end": "15:30"},
+    {"site": "Atlanta", "tz": "US/Eastern", "ccy": "USD", "start": "07:00", "end": "15:30"},
+    {"site": "Houston", "tz": "US/Central", "ccy": "USD", "start": "06:00", "end": "14:30"},
+    {"site": "Los Angeles", "tz": "US/Pacific", "ccy": "USD", "start": "07:00", "end": "15:30"},
+    {"site": "Monterrey", "tz": "America/Monterrey", "ccy": "MXN", "start": "07:00", "end": "17:00"},
+]
+
+
+@functools.lru_cache(maxsize=None)
+def get_tz(name):
+    # 시간대 객체는 프로세스당 1번만 생성
+    return pytz.timezone(name)
+
+
+def hhmm_to_min(value):
+    h, _, m = str(value).strip().partition(":")
+    return (int(h) * 60 + int(m or 0)) % DAY_MIN
+
+
+def utc_offsets(zones, now=None):
+    """한 시각(now, UTC) 기준 각 시간대의 UTC 오프셋 (분) 배열 — DST 반영."""
+    now = now or datetime.now(timezone.utc)
+    return np.array([now.astimezone(get_tz(z)).utcoffset().total_seconds() / 60 for z in zones])
+
+
+def _local_shifts(sites):
+    start = np.array([hhmm_to_min(s["start"]) for s in sites], dtype=float)
+    end = np.array([hhmm_to_min(s["end"]) for s in sites], dtype=float)
+    return start, end
+
+
+# ==========================================
+# ⏰ 다중 시간대 시계
+# ==========================================
+def clock_board(sites, now=None):
+    """현장별 현지 시각 / 근무 여부를 한 타임스탬프에서 계산.
+
+    반환: 행 목록 (site, date, local, utc_offset_h, on_shift)
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    off = utc_offsets([s["tz"] for s in sites], now)
+    local = np.datetime64(now.replace(tzinfo=None), "m") + off.astype("timedelta64[m]")
+    stamp = np.datetime_as_string(local, unit="m")  # YYYY-MM-DDTHH:MM
+    local_min = (local - local.astype("datetime64[D]")).astype(int)
+    start, end = _local_shifts(sites)
+    on = np.where(start < end, (local_min >= start) & (local_min < end), (local_min >= start) | (local_min < end))
+    return [{"site": s["site"], "date": t[5:10], "local": t[11:16], "utc_offset_h": float(o) / 60, "on_shift": bool(f)}
+            for s, t, o, f in zip(sites, stamp, off, on)]
+
+
+# ==========================================
+# 🤝 근무시간 겹침
+# ==========================================
+def shift_intervals(sites, now=None):
+    """현지 근무시간 → UTC 기준 [시작, 종료) 분 (시작은 0~1440, 야간조는 종료가 1440 을 넘음)."""
+    off = utc_offsets([s["tz"] for s in sites], now)
+    start, end = _local_shifts(sites)
+    length = np.mod(end - start, DAY_MIN)
+    length = np.where(length == 0, DAY_MIN, length)
+    s_utc = np.mod(start - off, DAY_MIN)
+    return s_utc, s_utc + length
+
+
+def overlap_matrix(starts, ends):
+    """현장 쌍별 겹치는 근무시간 (분) 행렬.
+
+    24시간 주기이므로 상대 구간을 -1/0/+1 일 이동한 3개 복사본과 교집합을 한 번에 계산한다.
+    """
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    shift = np.array([-DAY_MIN, 0, DAY_MIN])[:, None, None]
+    lo = np.maximum(starts[None, :, None], starts[None, None, :] + shift)
+    hi = np.minimum(ends[None, :, None], ends[None, None, :] + shift)
+    return np.clip(hi - lo, 0, None).sum(axis=0)
+
+
+def coverage(starts, ends, step=15):
+    """UTC 하루를 step 분 칸으로 나눠 칸마다 근무 중인 현장 수 (차분 배열 + 누적합)."""
+    n_bins = DAY_MIN // step
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    # 자정을 넘는 구간은 두 조각으로
+    lo = np.concatenate([starts, np.zeros(np.sum(ends > DAY_MIN))])
+    hi = np.concatenate([np.minimum(ends, DAY_MIN), ends[ends > DAY_MIN] - DAY_MIN])
+    b_lo = np.ceil(lo / step).astype(int)
+    b_hi = np.floor(hi / step).astype(int)
+    keep = b_hi > b_lo
+    diff = np.bincount(b_lo[keep], minlength=n_bins + 1) - np.bincount(b_hi[keep], minlength=n_bins + 1)
+    return np.cumsum(diff)[:n_bins]
+
+
+def common_windows(starts, ends, min_sites=None, step=15):
+    """min_sites 개 이상 (기본: 전체) 동시에 근무하는 UTC 구간 목록 [(시작 분, 종료 분)]."""
+    count = coverage(starts, ends, step)
+    need = len(starts) if min_sites is None else min_sites
+    ok = np.concatenate([[False], count >= need, [False]])
+    edges = np.flatnonzero(np.diff(ok.astype(int)))
+    runs = [(int(a) * step, int(b) * step) for a, b in zip(edges[::2], edges[1::2])]
+    # 자정을 걸치는 구간은 하나로 합침
+    if len(runs) > 1 and runs[0][0] == 0 and runs[-1][1] == DAY_MIN:
+        runs = [(runs[-1][0], runs[0][1] + DAY_MIN)] + runs[1:-1]
+    return runs
+
+
+def fmt_min(m, offset=0):
+    # UTC 분 → 기준 시간대 HH:MM
+    m = int(round(m + offset)) % DAY_MIN
+    return f"{m // 60:02d}:{m % 60:02d}"
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+from core.catalog import get_catalog
+
+MM_PER_IN = 25.4
+
+# 판정 코드 / 라벨
+PERFECT, USABLE, LOOSE, UNUSABLE = 0, 1, 2, 3
+FIT_LABELS = {PERFECT: "✅ 완벽 호환 (Perfect)", USABLE: "✅ 사용 가능 (Usable)",
+              LOOSE: "⚠️ 헐거움 (Loose) - 비상시만", UNUSABLE: "❌ 사용 불가 (Unusable)"}
+
+# 허용 오차 (clearance = 공구 - 볼트머리, mm)
+PERFECT_MM = 0.1  # |c| 이하면 완벽
+TIGHT_MM = 0.3  # 공구가 이만큼까지 작으면 꽉 끼지만 사용 가능, 더 작으면 안 들어감
+USABLE_PCT = 1.5  # 헐거움 허용 (볼트머리 대비 %), 최소 TIGHT_MM
+LOOSE_PCT = 3.0  # 이 이상 헐거우면 모서리 뭉개짐 → 사용 불가
+
+FRACTION_RE = r'^\s*(?:(\d+)[-\s]+)?(\d+)/(\d+)\s*(?:"|in|inch)?\s*$'
+DECIMAL_RE = r'^\s*(\d*\.?\d+)\s*(mm|"|in|inch)?\s*$'
+
+
+def parse_sizes(labels):
+    """규격 문자열 배열 → (size_mm, is_inch) 배열. 해석 불가는 nan.
+
+    분수(7/16, 1-1/8")는 인치, 숫자는 단위(", in, mm)를 따르고 단위가 없으면 mm.
+    """
+    s = pd.Series(labels, dtype=object).astype(str).str.lower()
+    frac = s.str.extract(FRACTION_RE).astype(float)
+    dec = s.str.extract(DECIMAL_RE)
+    frac_in = frac[0].fillna(0) + frac[1] / frac[2]
+    dec_val = dec[0].astype(float)
+    dec_inch = dec[1].isin(['"', "in", "inch"])
+    is_inch = frac_in.notna() | dec_inch
+    size_in = frac_in.where(frac_in.notna(), dec_val.where(dec_inch))
+    size_mm = np.where(is_inch, size_in * MM_PER_IN, dec_val)
+    return size_mm.astype(float), is_inch.to_numpy()
+
+
+def parse_size(label):
+    size_mm, is_inch = parse_sizes([label])
+    return (None, None) if np.isnan(size_mm[0]) else (float(size_mm[0]), bool(is_inch[0]))
+
+
+def classify_fit(nut_mm, tool_mm):
+    nut_mm, tool_mm = np.asarray(nut_mm, dtype=float), np.asarray(tool_mm, dtype=float)
+    c = np.round(tool_mm - nut_mm, 6)  # 25.4 환산 부동소수 오차 제거
+    pct = c / nut_mm * 100
+    usable_mm = np.maximum(TIGHT_MM, nut_mm * USABLE_PCT / 100)
+    return np.select([np.abs(c) <= PERFECT_MM, c < -TIGHT_MM, c <= usable_mm, pct <= LOOSE_PCT],
+                     [PERFECT, UNUSABLE, USABLE, LOOSE], UNUSABLE)
+
+
+def _tools(system):
+    rows = get_catalog().socket_sizes(system)
+    return np.array([r["size_mm"] for r in rows]), np.array([r["size"] for r in rows], dtype=object)
+
+
+# ==========================================
+# 🔧 최근접 공구 매칭 (이진 탐색)
+# ==========================================
+def match_sizes(size_mm, target_system):
+    """볼트머리 크기 배열에 대해 target_system 공구 중 가장 잘 맞는 것을 한 번에 찾음.
+
+    정렬된 공구 크기 배열에서 searchsorted 로 바로 아래/위 후보 2개를 구하고,
+    판정 등급 → |clearance| 순으로 더 나은 쪽을 고른다.
+    반환: (공구 라벨, 공구 mm, clearance mm, 판정 코드) 배열
+    """
+    sizes, labels = _tools(target_system)
+    size_mm = np.asarray(size_mm, dtype=float)
+    idx = np.searchsorted(sizes, size_mm)
+    lo = np.clip(idx - 1, 0, len(sizes) - 1)
+    hi = np.clip(idx, 0, len(sizes) - 1)
+    fit_lo, fit_hi = classify_fit(size_mm, sizes[lo]), classify_fit(size_mm, sizes[hi])
+    c_lo, c_hi = sizes[lo] - size_mm, sizes[hi] - size_mm
+    pick_hi = (fit_hi < fit_lo) | ((fit_hi == fit_lo) & (np.abs(c_hi) < np.abs(c_lo)))
+    best = np.where(pick_hi, hi, lo)
+    return labels[best], sizes[best], sizes[best] - size_mm, np.where(pick_hi, fit_hi, fit_lo)
+
+
+def match_size(label):
+    # 단건: 반대 규격계 최적 공구와 판정 문구
+    size_mm, is_inch = parse_size(label)
+    if size_mm is None:
+        return None
+    tool, tool_mm, c, fit = (x[0] for x in match_sizes([size_mm], "MM" if is_inch else "SAE"))
+    return {"size_mm": size_mm, "tool": tool, "tool_mm": float(tool_mm), "clearance_mm": float(c),
+            "fit": int(fit), "verdict": f"{FIT_LABELS[int(fit)]} ({round(size_mm, 1):g}mm vs {round(float(tool_mm), 1):g}mm)"}
+
+
+def map_inventory(labels):
+    """공구 목록 전체를 반대 규격계로 매핑 (인치 → mm 공구, mm → 인치 공구)."""
+    size_mm, is_inch = parse_sizes(labels)
+    out = pd.DataFrame({"size": labels, "size_mm": size_mm, "system": np.where(is_inch, "SAE", "MM")})
+    out["match"], out["match_mm"], out["clearance_mm"], out["fit"] = None, np.nan, np.nan, np.nan
+    for system, target in (("SAE", "MM"), ("MM", "SAE")):
+        sel = (out["system"] == system) & out["size_mm"].notna()
+        if sel.any():
+            tool, tool_mm, c, fit = match_sizes(out.loc[sel, "size_mm"].to_numpy(), target)
+            out.loc[sel, "match"], out.loc[sel, "match_mm"] = tool, tool_mm
+            out.loc[sel, "clearance_mm"], out.loc[sel, "fit"] = c, fit
+    out["verdict"] = out["fit"].map(FIT_LABELS).fillna("해석 불가")
+    return out
@@ -0,0 +1,59 @@
+import functools
+import importlib
+import time
+
+import streamlit as st
+
+from core.metrics import METRICS
+
+# ==========================================
+# 🧭 메뉴 → 도구 모듈 레지스트리
+# ==========================================
+# 선택된 메뉴의 모듈만 import 하므로 (yfinance, pandas 등) 다른 도구의 의존성은
+# 실제로 열릴 때까지 로딩되지 않는다. import 된 모듈은 프로세스에 캐싱되어
+# 이후 rerun 에서는 render() 호출 비용만 든다.
+TOOLS = {
+    "☀️ 스마트 양생 (Concrete WX)": "curing",
+    "🛡️ 안전 관리 (Safety)": "safety",
+    "🛒 추천템 (Picks) 🔥": "picks",
+    "🚦 호환성 판독 (Compatibility)": "compat",
+    "📐 공학 계산 (Eng Calc)": "eng_calc",
+    "💰 생활/금융 (Life)": "life",
+    "📏 치수 변환 (Unit)": "unit",
+    "🏗️ 자재/배관 (Material)": "material",
+}
+
+
+def load(menu):
+    return importlib.import_module(f"{__name__}.{TOOLS[menu]}")
+
+
+
+# ==========================================
+# ⏱️ 계측 fragment
+# ==========================================
+def fragment(fn=None, **kwargs):
+    """st.fragment + 부분 rerun 계측.
+
+    fragment 만 다시 실행될 때는 converter.py 의 전체 rerun 계측을 거치지 않으므로
+    여기서 fragment_seconds / fragment_reruns 를 기록하고 메트릭 파일도 갱신한다.
+    """
+    if fn is None:
+        return lambda f: fragment(f, **kwargs)
+    labels = {"tool": fn.__module__.rsplit(".", 1)[-1], "fragment": fn.__name__.lstrip("_")}
+
+    @functools.wraps(fn)
+    def timed(*args, **kw):
+        t0 = time.perf_counter()
+        try:
+            with METRICS.track("fragment_seconds", **labels):
+                return fn(*args, **kw)
+        finally:
+            METRICS.inc("fragment_reruns", **labels)
+            st.session_state.last_fragment = (labels["fragment"], (time.perf_counter() - t0) * 1000)
+            try:
+                METRICS.write()  # 10초 간격 제한 있음
+            except OSError:
+                pass
+
+    return st.fragment(timed, **kwargs)
@@ -0,0 +1,71 @@
+import pandas as pd
+import streamlit as st
+
+from core.wrench import LOOSE, PERFECT, USABLE, map_inventory, match_size
+from tools import fragment
+
+
+@fragment
+def _wrench_socket():
+    c1, c2 = st.columns([1, 2])
+    with c1:
+        with st.container(border=True):
+            st.markdown("#### 규격 입력")
+            size = st.text_input("Size (inch / mm)", '1/2"')
+            st.caption('예: 7/16", 1-1/8", 0.75in, 13mm')
+
+    with c2:
+        res = match_size(size)
+
+        with st.container(border=True):
+            st.markdown("#### 🔍 판독 결과")
+            if res is None:
+                st.error("규격을 해석할 수 없습니다.")
+            else:
+                st.metric("대체 가능 공구", res["tool"], f"{res['clearance_mm']:+.2f} mm", delta_color="off")
+                if res["fit"] == PERFECT or res["fit"] == USABLE:
+                    st.success(res["verdict"])
+                elif res["fit"] == LOOSE:
+                    st.warning(res["verdict"])
+                else:
+                    st.error(res["verdict"])
+
+    with st.expander("🧰 공구함 일괄 판독 (Inventory)"):
+        sizes = st.text_area("공구 목록 (한 줄에 하나)", placeholder='1/2"\n9/16"\n13mm\n19mm')
+        up = st.file_uploader("또는 CSV 업로드 (첫 번째 컬럼)", type=["csv"])
+        labels = [x for x in sizes.splitlines() if x.strip()]
+        if up is not None:
+            labels += pd.read_csv(up, dtype=str).iloc[:, 0].dropna().tolist()
+        if labels:
+            inv = map_inventory(labels)
+            counts = inv["verdict"].value_counts()
+            st.caption(" · ".join(f"{k}: {v}" for k, v in counts.items()))
+            st.dataframe(inv.drop(columns=["fit"]), use_container_width=True, hide_index=True)
+
+
+# 4. 🚦 호환성
+def render():
+    st.header("🚦 호환성 판독 (Compatibility)")
+    st.caption("현장에서 가장 헷갈리는 규격 호환 여부 판독기")
+
+    comp_tabs = st.tabs(["🔧 렌치/소켓", "🔩 배관 나사", "🔘 플랜지"])
+
+    with comp_tabs[0]:
+        _wrench_socket()
+
+    with comp_tabs[1]:
+        with st.container(border=True):
+            st.markdown("#### 🔩 NPT(미국) vs PT(한국) 배관")
+            c1, c2 = st.columns(2)
+            c1.error("🚫 호환 불가")
+            c1.write("억지로 끼우면 100% 누수 발생")
+            c2.info("💡 해결책")
+            c2.write("반드시 **변환 어댑터** 사용")
+            st.divider()
+            st.markdown("- **NPT**: 60도 나사산 (미국 표준)\n- **PT(BSP)**: 55도 나사산 (한국/유럽 표준)")
+
+    with comp_tabs[2]:
+        with st.container(border=True):
+            st.markdown("#### 🔘 ANSI vs JIS 플랜지")
+            st.warning("⚠️ 호환 불가 (볼트 구멍 안 맞음)")
+            st.write("미국 ANSI 150#와 한국 JIS 10K는 볼트 구멍 간격(PCD)이 미세하게 달라서 볼트가 들어가지 않습니다.")
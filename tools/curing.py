@@ -0,0 +1,265 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.curing import (RISK_LABELS, TEMP_LABELS, best_pour_windows, calc_evaporation_rate, evap_risk, low_risk_runs,
+                         score_forecast, temp_class)
+from core.maturity import LOGGER_DIR, MaturityTracker, logger_path
+from core.metrics import METRICS
+from core.weather import WeatherCache, fetch_many, forecast_arrays, parse_current, parse_hourly
+from tools import fragment
+
+
+# --- 날씨 함수 ---
+@st.cache_resource
+def get_weather_cache():
+    # 모든 세션이 공유하는 프로세스 단위 캐시 (keep-alive 세션 포함)
+    cache = WeatherCache(ttl=600, stale_ttl=3600, timeout=5)
+    # 이벤트 수는 누적 카운터, 항목 수는 게이지
+    METRICS.collector("weather_cache", lambda: {k: v for k, v in cache.stats().items() if k != "size"},
+                      label="event", kind="counter")
+    METRICS.collector("weather_cache_entries", lambda: cache.stats()["size"])
+    return cache
+
+
+def get_weather_data(location):
+    # 지연시간은 실제 업스트림 호출만 (core.weather 의 upstream_seconds) — 여기서는 실패 수만 기록
+    try:
+        t, h, w = parse_current(get_weather_cache().get(location))
+        return t, h, w, None
+    except:
+        METRICS.inc("lookup_errors", call="get_weather_data")
+        return None, None, None, "Error"
+
+
+def get_weather_forecast(location):
+    # 현재 날씨와 같은 캐시 항목 재사용 (추가 호출 없음)
+    try:
+        return parse_hourly(get_weather_cache().get(location), upcoming=True), None
+    except:
+        return None, "Error"
+
+
+def site_report(locations, window_hr=6):
+    results = fetch_many(get_weather_cache(), locations, max_workers=8, timeout=8)
+    ok_sites = [loc for loc, (data, err) in results.items() if not err]
+
+    # 전 현장 예보를 한 번에 평가 → 현장별 최적 타설 시작 시각
+    best_start = {}
+    if ok_sites:
+        times, tf, rh, wind = forecast_arrays([results[loc][0] for loc in ok_sites])
+        if times.shape[1] > 1:
+            longest = times[(~np.isnat(times)).sum(axis=1).argmax()]  # 짧은 현장은 뒤가 NaT
+            step_hr = (longest[1] - longest[0]) / np.timedelta64(1, "h")
+            evap, _, _, ok = score_forecast(tf, rh, wind)
+            starts, _ = best_pour_windows(evap, ok, max(1, math.ceil(window_hr / step_hr)))
+            # 라벨은 각 현장의 현지 시각
+            best_start = {loc: (pd.Timestamp(row[i]).strftime('%m/%d %H:%M') if i >= 0 else "없음")
+                          for loc, row, i in zip(ok_sites, times, starts)}
+
+    rows = []
+    for loc, (data, err) in results.items():
+        if err:
+            rows.append({"현장": loc, "기온 (°F)": None, "습도 (%)": None, "풍속 (mph)": None,
+                         "온도 조건": f"❌ {err}", "증발률 (lb/ft²/hr)": None, "균열 위험도": "-",
+                         f"최적 타설 ({window_hr}h, 현지)": "-"})
+            continue
+        t, h, w = parse_current(data)
+        e = calc_evaporation_rate((t - 32) * 5 / 9, h, w)
+        rows.append({"현장": loc, "기온 (°F)": t, "습도 (%)": h, "풍속 (mph)": w,
+                     "온도 조건": temp_class(t), "증발률 (lb/ft²/hr)": round(e, 3), "균열 위험도": evap_risk(e),
+                     f"최적 타설 ({window_hr}h, 현지)": best_start.get(loc, "-")})
+    return pd.DataFrame(rows)
+
+
+@fragment
+def _single_site():
+    col_main, col_res = st.columns([1, 1.2])  # 레이아웃 분할
+
+    with col_main:
+        with st.container(border=True):
+            st.markdown("#### 📍 현장 날씨 입력")
+            col_search, col_btn = st.columns([3, 1])
+            loc_input = col_search.text_input("위치 검색 (City or ZIP)", placeholder="예: Atlanta, 30303")
+            if col_btn.button("🔍 검색", use_container_width=True):
+                if loc_input:
+                    with st.spinner("날씨 정보 수신 중..."):
+                        t, h, w, err = get_weather_data(loc_input)
+                        if err:
+                            st.error("위치를 찾을 수 없습니다.")
+                        else:
+                            st.session_state.temp_val = t
+                            st.session_state.humid_val = int(h)
+                            st.session_state.wind_val = w
+                            st.success(f"✅ 로딩 완료: {loc_input}")
+
+            st.divider()
+            st.caption("또는 수동 입력")
+            temp_f = st.number_input("기온 (Temp °F)", value=st.session_state.temp_val, format="%.1f")
+            humid = st.number_input("습도 (Humidity %)", value=st.session_state.humid_val)
+            wind = st.number_input("풍속 (Wind mph)", value=st.session_state.wind_val)
+
+    with col_res:
+        evap_rate = calc_evaporation_rate((temp_f - 32) * 5 / 9, humid, wind)
+        temp_c = (temp_f - 32) * 5 / 9
+
+        with st.container(border=True):
+            st.markdown("#### 📊 분석 리포트")
+
+            # 온도 분석
+            st.markdown("**1. 온도 조건 (Temperature)**")
+            c1, c2 = st.columns(2)
+            c1.metric("섭씨 변환", f"{temp_c:.1f}°C")
+            if temp_f < 40:
+                c2.error("❄️ 한중 (Cold)")
+                st.caption("🚨 40°F 미만! 보온 양생(Heating) 필수")
+            elif temp_f > 90:
+                c2.error("🔥 서중 (Hot)")
+                st.caption("🚨 90°F 초과! 쿨링(Cooling) 대책 수립")
+            else:
+                c2.success("✅ 적정 (Good)")
+                st.caption("양생하기 좋은 온도입니다.")
+
+            st.divider()
+
+            # 증발률 분석
+            st.markdown("**2. 균열 위험도 (Evaporation Rate)**")
+            st.metric("수분 증발률", f"{evap_rate:.3f}", "lb/ft²/hr")
+
+            if evap_rate > 0.2:
+                st.error("🚨 위험 (Critical) - 즉시 조치 필요")
+                st.markdown("- 콘크리트 타설 즉시 **방풍막** 설치\n- **포깅(Fogging)** 장비 가동 필수")
+            elif evap_rate > 0.1:
+                st.warning("⚠️ 주의 (Caution) - 모니터링")
+                st.markdown("- 표면 건조 주의, 양생제 도포 철저")
+            else:
+                st.success("✅ 안전 (Safe) - 작업 양호")
+
+
+@fragment
+def _multi_site():
+    with st.container(border=True):
+        st.markdown("#### 🗺️ 다중 현장 대시보드")
+        sites = st.text_area("현장 목록 (한 줄에 하나)", placeholder="Atlanta\n30303\nSeoul", height=150)
+        if st.button("🔍 전체 조회", use_container_width=True):
+            site_list = sites.splitlines()
+            if any(x.strip() for x in site_list):
+                with st.spinner("날씨 정보 동시 수신 중..."):
+                    st.session_state.site_report = site_report(site_list)
+        if "site_report" in st.session_state:
+            st.dataframe(st.session_state.site_report, use_container_width=True, hide_index=True)
+
+
+@fragment
+def _pour_planner():
+    with st.container(border=True):
+        st.markdown("#### ⏱️ 시간별 타설 계획")
+        st.caption("72시간 예보 기준, 적정 온도 & 증발률 0.1 이하 연속 구간 탐색")
+        c1, c2 = st.columns([3, 1])
+        plan_loc = c1.text_input("위치 (City or ZIP)", placeholder="예: Atlanta", key="plan_loc")
+        window_hr = c2.number_input("타설 소요 (hr)", 1, 24, 6)
+        if plan_loc:
+            fc, err = get_weather_forecast(plan_loc)
+            if err or fc is None or fc.empty:
+                st.error("예보를 불러올 수 없습니다.")
+            else:
+                evap, tcode, rcode, ok = score_forecast(fc["temp_F"], fc["humidity"], fc["wind_mph"])
+                step_hr = (fc["time"].iloc[1] - fc["time"].iloc[0]) / pd.Timedelta(hours=1) if len(fc) > 1 else 3
+                width = max(1, math.ceil(window_hr / step_hr))
+                starts, means = best_pour_windows(evap, ok, width)
+                if starts[0] >= 0:
+                    t0 = fc["time"].iloc[starts[0]]
+                    st.success(f"🎯 최적 타설: **{t0:%m/%d %H:%M}** ~ "
+                               f"{t0 + pd.Timedelta(hours=width * step_hr):%H:%M} (평균 증발률 {means[0]:.3f})")
+                else:
+                    st.warning(f"⚠️ {window_hr}시간 연속 저위험 구간 없음")
+                runs = low_risk_runs(ok)
+                st.caption("저위험 구간: " + (", ".join(
+                    f"{fc['time'].iloc[a]:%m/%d %H:%M}~{fc['time'].iloc[b - 1] + pd.Timedelta(hours=step_hr):%H:%M}"
+                    for a, b in runs) or "없음"))
+                table = fc.assign(evap=evap.round(3),
+                                  temp_class=pd.Series(tcode).map(TEMP_LABELS),
+                                  risk=pd.Series(rcode).map(RISK_LABELS))
+                st.dataframe(table.rename(columns={"time": "시각", "temp_F": "기온 (°F)", "humidity": "습도 (%)",
+                                                   "wind_mph": "풍속 (mph)", "evap": "증발률",
+                                                   "temp_class": "온도 조건", "risk": "균열 위험도"}),
+                             use_container_width=True, hide_index=True)
+
+
+@fragment
+def _maturity():
+    with st.container(border=True):
+        st.markdown("#### 🌡️ 적산온도 / 강도 추정 (Nurse-Saul)")
+        st.caption("ASTM C1074 — 온도 로거 CSV 를 청크 단위로 누적 (T0 = -10°C, 등가재령 기준 20°C)")
+        c1, c2, c3 = st.columns(3)
+        time_col = c1.text_input("시간 컬럼", "timestamp")
+        temp_col = c2.text_input("온도 컬럼", "temp_c")
+        unit = c3.radio("온도 단위", ["C", "F"], horizontal=True)
+        # 서버 파일 읽기는 TOOLBOX_LOGGER_DIR 이 설정된 경우 그 안에서만
+        sources = ["📤 업로드"] + (["📂 로거 파일 (append)"] if LOGGER_DIR else [])
+        src = st.radio("입력 방식", sources, horizontal=True)
+
+        trackers = st.session_state.setdefault("maturity_trackers", {})
+        tracker = None
+        try:
+            if "업로드" in src:
+                up = st.file_uploader("로거 CSV", type=["csv"])
+                if up is not None:
+                    key = (up.file_id, time_col, temp_col, unit)
+                    if key not in trackers:
+                        tracker = MaturityTracker(time_col, temp_col, unit)
+                        tracker.update_buffer(up, final=True)
+                        trackers[key] = tracker
+                    tracker = trackers[key]
+            else:
+                log_name = st.text_input("파일 이름 (로거 디렉터리 기준)", placeholder="pour_12.csv")
+                if log_name:
+                    try:
+                        log_path = logger_path(log_name)
+                    except ValueError as e:
+                        st.error(str(e))
+                        return
+                    key = (log_path, time_col, temp_col, unit)
+                    tracker = trackers.setdefault(key, MaturityTracker(time_col, temp_col, unit))
+                    if st.button("🔄 새 데이터 반영", use_container_width=True) or tracker.rows == 0:
+                        tracker.update_file(log_path)
+        except:
+            st.error("파일을 읽을 수 없습니다. 컬럼명을 확인하세요.")
+            tracker = None
+
+        if tracker is not None and tracker.rows:
+            st.divider()
+            m1, m2, m3 = st.columns(3)
+            m1.metric("적산온도 (TTF)", f"{tracker.ttf:,.0f} °C·hr")
+            m2.metric("등가재령", f"{tracker.eq_age / 24:.2f} 일")
+            m3.metric("추정 강도", f"{tracker.strength:,.0f} psi")
+            skipped = f" (결측 {tracker.skipped:,} 행 제외)" if tracker.skipped else ""
+            st.caption(f"{tracker.rows:,} 행{skipped} · {tracker.first_time:%m/%d %H:%M} ~ {tracker.last_time:%m/%d %H:%M}"
+                       " · 강도식은 예시 계수이므로 배합별 검량값으로 교체 필요")
+
+
+# 1. ☀️ 스마트 양생
+def render():
+    # --- 세션 초기화 ---
+    if 'temp_val' not in st.session_state: st.session_state.temp_val = 75.0
+    if 'humid_val' not in st.session_state: st.session_state.humid_val = 50
+    if 'wind_val' not in st.session_state: st.session_state.wind_val = 5.0
+
+    st.header("☀️ 스마트 콘크리트 양생 관리")
+    st.caption("ACI 305R/306R Standard Based Curing Manager")
+
+    cure_tabs = st.tabs(["📍 단일 현장", "🗺️ 다중 현장", "⏱️ 타설 계획 (72h)", "🌡️ 적산온도"])
+
+    with cure_tabs[0]:
+        _single_site()
+
+    with cure_tabs[1]:
+        _multi_site()
+
+    with cure_tabs[2]:
+        _pour_planner()
+
+    with cure_tabs[3]:
+        _maturity()
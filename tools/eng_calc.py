@@ -0,0 +1,141 @@
+import pandas as pd
+import streamlit as st
+
+from core.cable_tray import segment_fill, size_trays
+from core.calc import SLOPES, TRAY_FILL_LIMIT, bolt_torque, load_moment, pipe_drop, tray_fill
+from core.catalog import get_catalog
+from core.crane import CRITICAL_PCT, STATUS_LABELS, get_charts, utilization
+from tools import fragment
+
+
+@fragment
+def _bolt_torque():
+    with st.container(border=True):
+        st.markdown("#### 볼트 적정 토크 (AISC)")
+        catalog = get_catalog()
+        c1, c2 = st.columns(2)
+        gr = c2.selectbox("등급 (Grade)", catalog.bolt_grades())
+        sz = c1.selectbox("볼트 직경", catalog.bolt_sizes(gr))
+        bolt = catalog.bolt(gr, sz)
+        st.divider()
+        st.success(f"🎯 권장 토크: **{bolt_torque(sz, gr)} ft-lbs**")
+        st.caption(f"최소 프리텐션 (AISC J3.1): {bolt['pretension_kips']:g} kips ({bolt['pretension_kn']:,.0f} kN)")
+
+
+@fragment
+def _pipe_drop():
+    with st.container(border=True):
+        st.markdown("#### 배관 높이 차이 (Drop)")
+        c1, c2 = st.columns(2)
+        l = c1.number_input("배관 길이 (ft)", 100.0)
+        s = c2.select_slider("구배 (Slope)", list(SLOPES))
+        drop = pipe_drop(l, s)
+        st.divider()
+        st.info(f"⬇️ 높이 차이: **{drop:.2f} inch** ({drop * 25.4:.1f} mm)")
+
+
+@fragment
+def _crane_moment():
+    with st.container(border=True):
+        st.markdown("#### 크레인 부하 모멘트")
+        charts = get_charts()
+        c1, c2 = st.columns(2)
+        w = c1.number_input("인양 무게 (lbs)", 5000)
+        r = c2.number_input("작업 반경 (ft)", 50)
+        c3, c4, c5 = st.columns(3)
+        crane = c3.selectbox("크레인", charts.cranes())
+        config = c4.selectbox("구성 (Config)", charts.configs(crane))
+        boom = c5.number_input("붐 길이 (ft)", 70.0)
+        st.divider()
+        chart = charts.chart(crane, config)
+        # 판정은 보수적 정격 하중 기준 (보간값은 참고용)
+        cap = float(chart.capacity(boom, r, method="conservative"))
+        cap_interp = float(chart.capacity(boom, r))
+        pct, status = utilization(w, cap)
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Load Moment", f"{load_moment(w, r):,.0f} lbs-ft")
+        m2.metric("정격 하중 (보수적)", "-" if status == 3 else f"{cap:,.0f} lbs",
+                  None if status == 3 else f"보간: {cap_interp:,.0f} lbs", delta_color="off")
+        m3.metric("사용률", "-" if status == 3 else f"{pct:.1f}%")
+        msg = STATUS_LABELS[int(status)]
+        if status == 0:
+            st.success(msg)
+        elif status == 1:
+            st.warning(f"{msg} — {CRITICAL_PCT:.0f}% 초과, 인양 계획서 필요")
+        else:
+            st.error(msg)
+        st.caption("⚠️ 기본 차트는 예시 데이터입니다. 실제 양중에는 제조사 Load Chart 를 사용하세요.")
+
+    with st.expander("📋 인양 계획 일괄 검토 (Lift Plan)"):
+        st.caption("CSV: crane, config, boom_ft, radius_ft, load_lbs [, rigging_lbs]")
+        lift_file = st.file_uploader("인양 계획", type=["csv"])
+        if lift_file is not None:
+            try:
+                res = charts.check_lifts(pd.read_csv(lift_file, thousands=","))
+                st.caption(" · ".join(f"{k}: {v:,}" for k, v in res["status"].value_counts().items()))
+                st.dataframe(res, use_container_width=True, hide_index=True)
+            except (KeyError, TypeError, ValueError):
+                st.error("CSV 컬럼을 확인하세요.")
+
+
+@fragment
+def _tray_fill():
+    with st.container(border=True):
+        st.markdown("#### 트레이 채움률 계산")
+        c1, c2, c3 = st.columns(3)
+        w = c1.selectbox("폭 (Width)", [12, 18, 24, 30, 36])
+        d = c2.selectbox("깊이 (Depth)", [4, 6])
+        dia = c3.number_input("케이블 외경 (inch)", 1.0)
+        cnt = st.slider("가닥수", 1, 100, 20)
+
+        ratio = tray_fill(w, d, dia, cnt)
+        st.divider()
+        st.metric("현재 채움률", f"{ratio:.1f}%", f"Limit: {TRAY_FILL_LIMIT:.0f}%")
+        if ratio > TRAY_FILL_LIMIT:
+            st.error("❌ 초과 (Overfilled)")
+        else:
+            st.success("✅ 적합 (Pass)")
+
+    with st.expander("📋 케이블 스케줄 일괄 검토 (Cable Schedule)"):
+        st.caption("케이블 CSV: segment, dia_in · 트레이 CSV (선택): segment, width_in, depth_in")
+        c1, c2 = st.columns(2)
+        cable_file = c1.file_uploader("케이블 스케줄", type=["csv"])
+        tray_file = c2.file_uploader("트레이 구간", type=["csv"])
+        if cable_file is not None:
+            try:
+                cables = pd.read_csv(cable_file, usecols=["segment", "dia_in"])
+                trays = pd.read_csv(tray_file) if tray_file is not None else None
+                if trays is not None:
+                    fill = segment_fill(cables, trays)
+                    st.metric("초과 구간", f"{int(fill['over'].sum()):,} / {len(fill):,}", f"Limit: {TRAY_FILL_LIMIT:.0f}%",
+                              delta_color="off")
+                    if fill["no_tray"].any():
+                        st.error(f"🚫 트레이 정보가 없는 구간 {int(fill['no_tray'].sum()):,}개 — 트레이 CSV 를 확인하세요.")
+                    # 트레이 없는 구간 (채움률 nan) 을 맨 위에
+                    st.dataframe(fill.sort_values("fill_pct", ascending=False, na_position="first"),
+                                 use_container_width=True, hide_index=True)
+                plan, _ = size_trays(cables)
+                st.markdown("**📦 최소 트레이 선정 결과**")
+                st.dataframe(plan, use_container_width=True, hide_index=True)
+                st.download_button("⬇️ 선정 결과 CSV", plan.to_csv(index=False), "tray_plan.csv", "text/csv")
+            except (KeyError, ValueError):
+                st.error("CSV 컬럼을 확인하세요.")
+
+
+# 5. 공학 계산
+def render():
+    st.header("📐 공학 계산기")
+
+    sub_tabs = st.tabs(["🔧 볼트 토크", "📉 배관 구배", "🏗️ 크레인", "⚡ 케이블 트레이"])
+
+    with sub_tabs[0]:
+        _bolt_torque()
+
+    with sub_tabs[1]:
+        _pipe_drop()
+
+    with sub_tabs[2]:
+        _crane_moment()
+
+    with sub_tabs[3]:
+        _tray_fill()
@@ -0,0 +1,240 @@
+import io
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.calc import net_salary, overtime_cost, tip_per_person
+from core.fx import PAIRS, FxStore
+from core.labor import DT_AFTER, ST_HOURS, simulate_overtime, summarize
+from core.metrics import METRICS
+from core.worldclock import (DEFAULT_SITES, clock_board, common_windows, coverage, fmt_min, get_tz, overlap_matrix,
+                             shift_intervals)
+from tools import fragment
+
+
+# --- 캐싱 함수 ---
+@st.cache_resource
+def get_fx_store():
+    return FxStore()
+
+
+@st.cache_data(ttl=600)
+def _load_exchange_rates():
+    # 디스크 캐시 갱신 (프로세스 간 1시간에 1번) 후 마지막으로 알려진 환율 반환
+    METRICS.inc("cache_misses", cache="fx_rates")
+    store = get_fx_store()
+    store.refresh(min_interval=3600)
+    return store.latest()
+
+
+def get_exchange_rates():
+    # 캐시 조회 수 - miss 수 = hit 수 (지연시간은 core.fx 의 upstream_seconds 가 실제 호출만 기록)
+    METRICS.inc("cache_requests", cache="fx_rates")
+    try:
+        return _load_exchange_rates()
+    except Exception:
+        METRICS.inc("lookup_errors", call="get_exchange_rates")
+        return {}
+
+
+@st.cache_data(max_entries=8, show_spinner="시뮬레이션 중...")
+def _simulate_overtime(data, trials, slip, noise):
+    # 같은 일정표 (바이트) + 조건이면 재계산하지 않음
+    return simulate_overtime(pd.read_csv(io.BytesIO(data)), trials, slip, noise)
+
+
+@fragment
+def _fx():
+    with st.container(border=True):
+        st.markdown("#### 💱 실시간 환율")
+        rates = get_exchange_rates()
+        if not rates:
+            st.warning("환율 정보를 불러올 수 없습니다.")
+            return
+        ccy = st.radio("통화", [c for c in PAIRS if c in rates], horizontal=True)
+        info = rates[ccy]
+        st.metric(f"USD/{ccy}", f"{info['rate']:,.2f}")
+        usd = st.number_input("달러 ($)", 1000)
+        st.caption(f"≒ {usd * info['rate']:,.2f} {ccy}")
+        age_hr = (time.time() - info["fetched_at"]) / 3600 if info["fetched_at"] else None
+        note = f"기준: {info['as_of']} 종가" + (f" · {age_hr:.1f}시간 전 수신" if age_hr is not None else "")
+        if (date.today() - info["as_of"]).days > 3:
+            st.warning(f"⚠️ 오래된 환율 — {note}")
+        else:
+            st.caption(note)
+
+
+def _clock_sites():
+    # 현장 목록 (시간대 / 통화 / 근무시간) — 세션별 편집
+    if "clock_sites" not in st.session_state:
+        st.session_state.clock_sites = [dict(s) for s in DEFAULT_SITES]
+    return st.session_state.clock_sites
+
+
+# 시계만 30초마다 다시 그림 (앱 전체 rerun 없음)
+@fragment(run_every="30s")
+def _world_clock():
+    with st.container(border=True):
+        st.markdown("#### ⏰ 세계 시계 & 환율 보드")
+        sites = _clock_sites()
+        if not sites:
+            st.info("현장을 추가하세요.")
+            return
+        rates = get_exchange_rates()
+        board = pd.DataFrame(clock_board(sites))
+        board["ccy"] = [s["ccy"] for s in sites]
+        board["USD 환율"] = [1.0 if c == "USD" else rates.get(c, {}).get("rate") for c in board["ccy"]]
+        board["on_shift"] = np.where(board["on_shift"], "🟢 근무", "⚪ -")
+        st.dataframe(board.rename(columns={"site": "현장", "date": "날짜", "local": "현지 시각",
+                                           "utc_offset_h": "UTC±", "on_shift": "상태", "ccy": "통화"}),
+                     hide_index=True, use_container_width=True)
+        st.caption(f"UTC {datetime.now(timezone.utc).strftime('%H:%M')} 기준 · 30초마다 갱신")
+
+
+@fragment
+def _shift_overlap():
+    with st.container(border=True):
+        st.markdown("#### 🤝 현장 근무시간 겹침")
+        with st.expander("⚙️ 현장 / 근무시간 설정"):
+            # 편집 내용은 위젯 상태에 누적되므로 원본은 항상 기본 목록을 넘김
+            edited = st.data_editor(pd.DataFrame(DEFAULT_SITES), num_rows="dynamic", hide_index=True,
+                                    use_container_width=True, key="clock_editor")
+            sites = edited.dropna(subset=["site", "tz", "start", "end"]).fillna({"ccy": "USD"}).to_dict("records")
+            try:
+                for s in sites:
+                    get_tz(s["tz"])
+                shift_intervals(sites)
+            except Exception as e:
+                st.error(f"시간대 또는 근무시간 형식을 확인하세요 (예: Asia/Seoul, 07:30) — {e}")
+                return
+            st.session_state.clock_sites = sites
+        if len(sites) < 2:
+            st.info("현장이 2개 이상 필요합니다.")
+            return
+
+        names = [s["site"] for s in sites]
+        c1, c2 = st.columns(2)
+        base = c1.selectbox("기준 현장 (표시 시간대)", names)
+        picked = c2.multiselect("겹침 계산 현장", names, default=names[:3])
+        now = datetime.now(timezone.utc)
+        base_off = now.astimezone(get_tz(sites[names.index(base)]["tz"])).utcoffset() / timedelta(minutes=1)
+
+        starts, ends = shift_intervals(sites, now)
+        sel = [names.index(n) for n in picked]
+        if len(sel) >= 2:
+            windows = common_windows(starts[sel], ends[sel])
+            if windows:
+                spans = ", ".join(f"{fmt_min(a, base_off)}~{fmt_min(b, base_off)} ({(b - a) / 60:g}h)" for a, b in windows)
+                st.success(f"✅ 공통 근무시간 ({base} 기준): {spans}")
+            else:
+                st.warning("⚠️ 선택한 현장이 모두 겹치는 근무시간이 없습니다.")
+
+        # 15분 단위 근무 현장 수 (기준 현장 시간)
+        cover = coverage(starts, ends)
+        shift = int(round(base_off / 15))
+        st.bar_chart(pd.DataFrame({"근무 현장 수": np.roll(cover, shift)},
+                                  index=[fmt_min(m) for m in range(0, 24 * 60, 15)]))
+        matrix = pd.DataFrame(overlap_matrix(starts, ends) / 60, index=names, columns=names)
+        st.caption("현장 쌍별 겹치는 근무시간 (h)")
+        st.dataframe(matrix.round(1), use_container_width=True)
+
+
+@fragment
+def _overtime():
+    with st.container(border=True):
+        st.markdown("#### 💰 야근 비용 시뮬레이션")
+        c1, c2 = st.columns(2)
+        ppl = c1.number_input("투입 인원 (명)", 5)
+        rate_hr = c2.number_input("평균 시급 ($)", 40.0)
+        c3, c4 = st.columns(2)
+        hrs = c3.number_input("추가 시간 (hr)", 2.0)
+        mul = c4.radio("할증", ["1.5배", "2.0배"], horizontal=True)
+        m_val = 1.5 if "1.5" in mul else 2.0
+        st.divider()
+        st.metric("예상 추가 비용", f"${overtime_cost(ppl, rate_hr, hrs, m_val):,.0f}")
+
+    with st.expander("📋 크루 일정표 & 공정 지연 시뮬레이션 (Monte Carlo)"):
+        st.caption(f"CSV: crew, date, people, rate_hr, hours (1인 1일) · {ST_HOURS:g}h 초과 1.5배, {DT_AFTER:g}h 초과 2.0배")
+        up = st.file_uploader("일정표 업로드", type=["csv"])
+        if up is None:
+            return
+        try:
+            sched = pd.read_csv(up)
+            by_crew = summarize(sched)
+        except (KeyError, ValueError):
+            st.error("CSV 컬럼을 확인하세요.")
+            return
+        st.dataframe(by_crew, use_container_width=True, hide_index=True)
+        c1, c2, c3 = st.columns(3)
+        trials = c1.select_slider("시행 횟수", [10_000, 50_000, 100_000, 500_000], 100_000)
+        lo, hi = c2.slider("공정 지연 범위 (%)", 0, 100, (0, 30))
+        mode = c3.slider("최빈 지연 (%)", lo, max(hi, lo + 1), min(max(10, lo), hi)) if hi > lo else lo
+        noise = st.slider("크루-일 변동 (±%, 표준편차)", 0, 30, 10)
+        # 슬라이더를 움직일 때마다 돌리지 않고 실행 버튼으로만 (결과는 조건별 캐시)
+        params = (trials, (lo / 100, mode / 100, hi / 100), noise / 100)
+        if st.button("▶️ 시뮬레이션 실행", use_container_width=True):
+            st.session_state.ot_sim = (up.file_id, params)
+        last = st.session_state.get("ot_sim")
+        if last is None or last[0] != up.file_id:
+            st.info("조건을 정한 뒤 시뮬레이션을 실행하세요.")
+            return
+        if last[1] != params:
+            st.caption("⚠️ 조건이 바뀌었습니다 — 아래는 이전 조건의 결과입니다. 다시 실행하세요.")
+        res = _simulate_overtime(up.getvalue(), *last[1])
+        ot = res["ot"]
+        m1, m2, m3 = st.columns(3)
+        m1.metric("P50 야근 비용", f"${ot['P50']:,.0f}")
+        m2.metric("P80 야근 비용", f"${ot['P80']:,.0f}")
+        m3.metric("P95 야근 비용", f"${ot['P95']:,.0f}")
+        st.caption(f"총 인건비 P50 ${res['total']['P50']:,.0f} · P95 ${res['total']['P95']:,.0f}")
+        counts, edges = np.histogram(res["samples"], bins=40)
+        st.bar_chart(pd.DataFrame({"trials": counts}, index=np.round(edges[:-1], -2)))
+
+
+@fragment
+def _salary():
+    with st.container(border=True):
+        st.markdown("#### 💸 연봉 실수령액 (Net)")
+        s = st.number_input("계약 연봉 ($)", 80000, step=1000)
+        net = net_salary(s)  # 단순화된 세율
+        st.divider()
+        st.metric("월 예상 수령액", f"${net / 12:,.0f}")
+
+
+@fragment
+def _tip():
+    with st.container(border=True):
+        st.markdown("#### 🍽️ 팁 & 더치페이")
+        c1, c2 = st.columns(2)
+        bill = c1.number_input("청구 금액 ($)", 50.0)
+        tip = c2.slider("팁 비율 (%)", 15, 25, 18)
+        ppl = st.number_input("인원 수", 1)
+        st.divider()
+        st.metric("1인당 지불액", f"${tip_per_person(bill, tip, ppl):.2f}")
+
+
+# 6. 생활/금융
+def render():
+    st.header("💰 생활 & 금융")
+
+    sub_tabs = st.tabs(["💱 환율/시차", "💰 야근 비용", "💸 연봉 계산", "🍽️ 팁 계산"])
+
+    with sub_tabs[0]:
+        c1, c2 = st.columns([1, 1.4])
+        with c1:
+            _fx()
+        with c2:
+            _world_clock()
+        _shift_overlap()
+
+    with sub_tabs[1]:
+        _overtime()
+
+    with sub_tabs[2]:
+        _salary()
+
+    with sub_tabs[3]:
+        _tip()
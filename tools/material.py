@@ -0,0 +1,58 @@
+import streamlit as st
+
+from core.readymix import TRUCK_YD3, TakeoffPipeline
+from core.units import convert
+from tools import fragment
+
+
+@fragment
+def _takeoff():
+    with st.container(border=True):
+        st.markdown("#### 📐 물량 산출 (BIM Takeoff)")
+        st.caption("CSV: element_id, element_type, pour, level, pour_date, length, width, depth [, diameter, count]")
+        c1, c2 = st.columns(2)
+        unit = c1.selectbox("치수 단위", ["ft", "in", "m", "mm"])
+        truck = c2.number_input("트럭 적재량 (yd³)", 1.0, 14.0, TRUCK_YD3)
+        up = st.file_uploader("물량표 업로드", type=["csv"])
+        if up is None:
+            return
+        # 같은 이름의 파일을 다시 올리면 바뀐 부재만 재계산
+        pipes = st.session_state.setdefault("takeoff_pipes", {})
+        key = (up.name, unit)
+        pipe = pipes.get(key) or TakeoffPipeline(unit)
+        pipe.truck_yd3 = truck
+        try:
+            if pipe.last_run.get("file_id") != up.file_id:
+                pipe.run(up)
+                pipe.last_run["file_id"] = up.file_id
+                pipes[key] = pipe
+        except KeyError:
+            st.error("CSV 컬럼을 확인하세요.")
+            return
+        except ValueError as e:
+            st.error(f"물량표 오류: {e}")
+            return
+        summary = pipe.summary()
+        r = pipe.last_run
+        m1, m2, m3 = st.columns(3)
+        m1.metric("총 주문량", f"{summary['order_yd3'].sum():,.1f} yd³")
+        m2.metric("총 차량", f"{summary['trucks'].sum():,} 대")
+        m3.metric("변경 부재", f"{r['changed']:,}", f"삭제 {r['removed']:,}", delta_color="off")
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+        st.download_button("⬇️ 타설별 CSV", summary.to_csv(index=False), "pours.csv", "text/csv")
+
+
+# 8. 자재/배관
+def render():
+    st.header("🏗️ 자재/배관")
+    with st.container(border=True):
+        st.markdown("#### 🚛 레미콘 물량 변환")
+        c1, c2 = st.columns(2)
+        expr = c1.text_input("물량 (단위 생략 시 m³)", "10", help="예: 10, 10 m³, 250 ft³, 12 yd³")
+        try:
+            c2.metric("야드 (yd³)", f"{convert(expr, 'yd3', default_unit='m3'):.2f}")
+            c1.caption(f"= {convert(expr, 'm3', default_unit='m3'):.2f} m³")
+        except ValueError as e:
+            c2.error(str(e))
+
+    _takeoff()
@@ -0,0 +1,43 @@
+import streamlit as st
+
+
+# 3. 🛒 추천템
+def render():
+    st.header("🛒 PM's Pick: 현장 필구템")
+    st.caption("OSHA/ANSI 규격 만족 & 아마존 베스트셀러 엄선")
+
+    link_boot = "https://amzn.to/3YkSN1g"
+    link_glass = "https://amzn.to/3LgnNMS"
+    link_laser = "https://amzn.to/4smcR0J"
+    link_tool = "https://amzn.to/3YQyn02"
+
+    c1, c2, c3, c4 = st.columns(4)
+
+    with c1:
+        with st.container(border=True):
+            st.image("https://m.media-amazon.com/images/I/81+F-wV-QLL._AC_SY695_.jpg",
+                     caption="Timberland PRO")  # 이미지 예시 (실제론 안 뜰 수도 있음)
+            st.markdown("**🥾 안전화 대장**")
+            st.caption("방수/절연/편안함")
+            st.link_button("👉 최저가 보기", link_boot, use_container_width=True)
+
+    with c2:
+        with st.container(border=True):
+            st.markdown("**👓 안티포그 고글**")
+            st.caption("DeWalt (김서림 방지)")
+            st.write("배터리 공장 필수")
+            st.link_button("👉 최저가 보기", link_glass, use_container_width=True)
+
+    with c3:
+        with st.container(border=True):
+            st.markdown("**📏 그린 레이저**")
+            st.caption("Klein Tools")
+            st.write("전기/설비팀 추천")
+            st.link_button("👉 최저가 보기", link_laser, use_container_width=True)
+
+    with c4:
+        with st.container(border=True):
+            st.markdown("**🧰 끝판왕 공구**")
+            st.caption("DeWalt 247pcs")
+            st.write("현장 정비용 세트")
+            st.link_button("👉 최저가 보기", link_tool, use_container_width=True)
@@ -0,0 +1,138 @@
+import time
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from core.catalog import get_catalog
+from core.jha import (cache_stats, compose, export_packet, expand_tasks, html_document, load_plan, package_html,
+                      pdf_available)
+from tools import fragment
+
+
+@fragment
+def _builder():
+    catalog = get_catalog()
+    c1, c2 = st.columns([1, 2])
+    selected = st.session_state.setdefault("jha_selected", [])
+
+    with c1:
+        with st.container(border=True):
+            st.markdown("#### 작업 선택")
+            template = st.selectbox("📦 작업 패키지 템플릿", ["(직접 선택)", *catalog.jha_packages])
+            if template != "(직접 선택)" and st.button("템플릿 적용", use_container_width=True):
+                selected[:] = list(expand_tasks([template]))
+            query = st.text_input("🔍 작업 검색", placeholder="예: 추락, 용접, 밀폐")
+            if query:
+                tasks = [t["task"] for t in catalog.search_jha(query)]
+            else:
+                category = st.selectbox("분류", catalog.jha_categories())
+                tasks = [t["task"] for t in catalog.jha_tasks if t["category"] == category]
+            if not tasks:
+                st.info("검색 결과가 없습니다.")
+            # 검색/분류를 바꿔도 이미 고른 작업은 유지
+            picked = st.multiselect("작업 (복수 선택)", list(dict.fromkeys(selected + tasks)), default=selected)
+            selected[:] = picked
+
+    with c2:
+        if not selected:
+            return
+        merged = compose(tuple(selected))
+        h = "\n".join(f"- {x} — *{', '.join(src)}*" if len(selected) > 1 else f"- {x}"
+                      for x, src in merged["hazards"])
+        c = "\n".join(f"{i}. {x}" for i, (x, _) in enumerate(merged["controls"], 1))
+        with st.container(border=True):
+            st.markdown(f"#### 📄 {' + '.join(selected)} JHA")
+            st.warning(f"**⚠️ 위험 요인 (Hazards)**\n\n{h}")
+            st.success(f"**✅ 안전 대책 (Controls)**\n\n{c}")
+            m1, m2, m3 = st.columns(3)
+            crew = m1.text_input("크루", "A조")
+            location = m2.text_input("위치", "")
+            foreman = m3.text_input("작업반장", "")
+            pkg = {"date": date.today().isoformat(), "crew": crew, "location": location, "foreman": foreman,
+                   "tasks": tuple(selected)}
+            st.download_button("⬇️ JHA 문서 (HTML, 인쇄용)", html_document([package_html(pkg)], f"JHA {crew}"),
+                               f"JHA_{crew}.html", "text/html")
+
+
+@fragment
+def _batch():
+    with st.container(border=True):
+        st.markdown("#### 📦 일일 JHA 패킷 일괄 생성")
+        st.caption("CSV: date, crew, tasks (';' 로 구분, 작업명 또는 템플릿명) [, location, foreman]")
+        up = st.file_uploader("일일 작업계획 업로드", type=["csv"])
+        options = ["html", "csv"] + (["pdf"] if pdf_available() else [])
+        formats = st.multiselect("출력 형식", options, default=options)
+        if not pdf_available():
+            st.caption("ℹ️ PDF 는 fpdf2 와 한글 폰트 (TOOLBOX_PDF_FONT) 가 있을 때 사용 가능 — HTML 패킷을 브라우저에서 PDF 로 인쇄할 수 있습니다.")
+        if up is None:
+            return
+        try:
+            packages = load_plan(pd.read_csv(up, dtype=str).fillna("").to_dict("records"))
+        except KeyError:
+            st.error("CSV 컬럼을 확인하세요.")
+            return
+        except ValueError as e:
+            st.error(str(e))
+            return
+        st.caption(f"패키지 {len(packages):,}건 · 작업 {sum(len(p['tasks']) for p in packages):,}건")
+        key = (up.file_id, tuple(formats))
+        if st.button("🚀 패킷 생성", use_container_width=True):
+            t = time.perf_counter()
+            with st.spinner("JHA 문서 생성 중..."):
+                st.session_state.jha_packet = (key, export_packet(packages, formats), time.perf_counter() - t)
+        packet = st.session_state.get("jha_packet")
+        if packet and packet[0] == key:
+            _, data, secs = packet
+            st.success(f"✅ {len(packages):,}건 생성 완료 ({secs:.1f}초, {len(data) / 1024:,.0f} KB)")
+            day = packages[0]["date"] if packages else date.today().isoformat()
+            st.download_button("⬇️ JHA 패킷 (zip)", data, f"JHA_{day}.zip", "application/zip")
+            hits = cache_stats()["task_section_html"]
+            st.caption(f"작업 섹션 캐시: {hits['currsize']}종 · 재사용 {hits['hits']:,}회")
+
+
+# 2. 🛡️ 안전 관리
+def render():
+    st.header("🛡️ 안전 관리 (Safety Manager)")
+
+    tab1, tab2, tab3 = st.tabs(["📋 JHA 생성기", "🛑 치명적 위험 점검", "📦 일괄 생성 (Batch)"])
+
+    with tab1:
+        st.caption("작업별 위험성 평가 및 대책 자동 생성 — 여러 작업을 묶어 하나의 JHA 로")
+        _builder()
+
+    with tab2:
+        st.caption("Zero Tolerance: 위반 시 즉시 퇴출 항목 점검")
+        col_check, col_guide = st.columns([1, 1.5])
+
+        with col_check:
+            with st.container(border=True):
+                st.markdown("#### 점검 대상")
+                check = st.radio("항목", ["추락 (Fall)", "전기 (Electrical)", "LOTO (잠금)"])
+
+        with col_guide:
+            with st.container(border=True):
+                if "추락" in check:
+                    st.error("🚨 추락 위험 (Fall Protection)")
+                    st.markdown("""
+                    - [ ] **6ft(1.8m) 이상 높이**에서 안전고리를 체결했는가?
+                    - [ ] 고소작업대(Lift) **출입문**을 닫았는가?
+                    - [ ] 안전벨트 웨빙에 **손상**이 없는가?
+                    """)
+                elif "전기" in check:
+                    st.warning("⚡ 전기 위험 (Electrical Safety)")
+                    st.markdown("""
+                    - [ ] 모든 전동 공구에 **GFCI**를 사용 중인가?
+                    - [ ] 전선(Cord)의 **피복**이 벗겨지지 않았는가?
+                    - [ ] 분전반 앞 **36인치(90cm)** 공간이 확보되었는가?
+                    """)
+                elif "LOTO" in check:
+                    st.info("🔐 잠금장치 (Hazardous Energy)")
+                    st.markdown("""
+                    - [ ] 에너지원에 **자물쇠와 태그**가 있는가?
+                    - [ ] LOTO 대장에 **기록**되었는가?
+                    - [ ] **열쇠**를 작업자 본인이 소지했는가?
+                    """)
+
+    with tab3:
+        _batch()
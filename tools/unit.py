@@ -0,0 +1,67 @@
+import streamlit as st
+
+from core.calc import ft_to_mm, mm_to_ft
+from core.units import DISPLAY_UNITS, FACTORS, convert_many, format_ft_in, parse
+from tools import fragment
+
+DEFAULT_UNITS = ["in", "ft", "mm", "m"]
+
+
+@fragment
+def _expression():
+    with st.container(border=True):
+        st.markdown("#### 🔤 현장 표기 변환")
+        c1, c2 = st.columns([3, 1])
+        expr = c1.text_input("치수 입력", "10'-6 1/2\"")
+        default = c2.selectbox("단위 생략 시", DEFAULT_UNITS)
+        st.caption('예: 10\'-6 1/2", 3/8, 2.5 m, 1,200 mm, 12 ft², 3 yd³, 50 lb, 33평')
+        try:
+            base, dim = parse(expr, default)
+        except ValueError as e:
+            st.error(str(e))
+            return
+        cols = st.columns(len(DISPLAY_UNITS[dim]))
+        for col, u in zip(cols, DISPLAY_UNITS[dim]):
+            col.metric(u, f"{base / FACTORS[u][1]:,.4g}")
+        if dim == "length":
+            st.success(f"**{format_ft_in(base)}**")
+
+
+@fragment
+def _bulk():
+    with st.expander("📋 일괄 변환 (Bulk)"):
+        c1, c2 = st.columns(2)
+        to_unit = c1.selectbox("변환 단위", [u for units in DISPLAY_UNITS.values() for u in units])
+        default = c2.selectbox("단위 생략 시", DEFAULT_UNITS, key="bulk_default")
+        text = st.text_area("치수 목록 (한 줄에 하나)", placeholder="10'-6 1/2\"\n3/8\n2.5 m")
+        up = st.file_uploader("또는 CSV 업로드 (첫 번째 컬럼)", type=["csv"])
+        values = [x for x in text.splitlines() if x.strip()]
+        if not values and up is None:
+            return
+        import pandas as pd  # 입력이 있을 때만 로딩
+
+        if up is not None:
+            values += pd.read_csv(up, dtype=str).iloc[:, 0].dropna().tolist()
+        if values:
+            out = pd.DataFrame({"입력": values, to_unit: convert_many(values, to_unit, default)})
+            st.caption(f"{len(out):,} 행 · 해석 불가 {int(out[to_unit].isna().sum()):,} 행")
+            st.dataframe(out, use_container_width=True, hide_index=True)
+            st.download_button("⬇️ CSV", out.to_csv(index=False), "converted.csv", "text/csv")
+
+
+# 7. 치수 변환
+def render():
+    st.header("📏 치수 변환 (Unit Converter)")
+    _expression()
+    c1, c2 = st.columns(2)
+    with c1:
+        with st.container(border=True):
+            st.markdown("#### mm ➡️ ft-in")
+            mm = st.number_input("mm 입력", 1000)
+            st.success(f"**{mm_to_ft(mm):.2f} ft**")
+    with c2:
+        with st.container(border=True):
+            st.markdown("#### ft ➡️ mm")
+            ft = st.number_input("ft 입력", 10)
+            st.info(f"**{ft_to_mm(ft):.0f} mm**")
+    _bulk()